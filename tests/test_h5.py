@@ -2,6 +2,8 @@ import pathlib
 
 import h5py
 import helpers
+import numpy as np
+import pytest
 
 import toughio
 
@@ -30,3 +32,160 @@ def test_h5():
             "generator_history",
             "rock_history",
         ]
+
+
+@pytest.mark.parametrize(
+    "time_steps, variables, labels, lazy",
+    [
+        (None, None, None, False),
+        (None, None, None, True),
+        ([0, -1], ["X", "Y"], None, False),
+        (None, ["PRES"], None, False),
+        (None, ["HEAT", "PRES"], None, True),
+        (-1, None, ["AAA05", "AAA02"], False),
+    ],
+)
+def test_read_h5(time_steps, variables, labels, lazy):
+    filename = helpers.tempdir("output.h5")
+    tables = {"A1912": {"TIME": np.random.rand(10), "PRES": np.random.rand(10)}}
+
+    toughio.write_h5(
+        filename=filename,
+        elements=helpers.output_eleme,
+        connections=helpers.output_conne,
+        element_history=tables,
+    )
+    out = toughio.read_h5(
+        filename,
+        time_steps=time_steps,
+        variables=variables,
+        labels=labels,
+        lazy=lazy,
+    )
+    out.close()
+    out = toughio.read_h5(
+        filename,
+        time_steps=time_steps,
+        variables=variables,
+        labels=labels,
+        lazy=lazy,
+    )
+
+    assert sorted(out) == ["connections", "element_history", "elements"]
+    assert helpers.allclose(
+        tables["A1912"]["PRES"], out["element_history"]["A1912"]["PRES"][()]
+    )
+
+    elements = out["elements"]
+    elements = elements if isinstance(elements, list) else [elements]
+    time_steps = [time_steps] if isinstance(time_steps, int) else time_steps
+    outputs_ref = (
+        [helpers.output_eleme[i] for i in time_steps]
+        if time_steps is not None
+        else helpers.output_eleme
+    )
+    outputs_ref = (
+        [out_ref[labels] for out_ref in outputs_ref] if labels else outputs_ref
+    )
+
+    assert len(outputs_ref) == len(elements)
+    for out_ref, output in zip(outputs_ref, elements):
+        assert out_ref.time == output.time
+        assert list(out_ref.labels) == list(output.labels)
+        variables_ref = (
+            [k for k in variables if k in out_ref.data] if variables else out_ref.data
+        )
+        assert sorted(variables_ref) == sorted(output.data)
+
+        for k, v in output.data.items():
+            assert helpers.allclose(out_ref.data[k], v[()])
+
+    connections = out["connections"]
+    connections = connections if isinstance(connections, list) else [connections]
+    assert helpers.allclose(helpers.output_conne[-1].labels, connections[-1].labels)
+    assert sorted(
+        [k for k in variables if k in connections[-1].data]
+        if variables
+        else helpers.output_conne[-1].data
+    ) == sorted(connections[-1].data)
+
+    # Lazy datasets can no longer be read once the file is closed
+    with out:
+        pass
+
+    if lazy:
+        with pytest.raises(Exception):
+            elements[-1].data["PRES"][()]
+
+    with pytest.raises(ValueError):
+        toughio.read_h5(filename, variables=["PRES", "UNKNOWN"])
+
+
+@pytest.mark.parametrize(
+    "compression, shuffle",
+    [("gzip", False), ("lzf", True), (None, False)],
+)
+def test_h5_series(compression, shuffle):
+    filename = helpers.tempdir("output.h5")
+
+    # Append time steps one by one
+    for i, output in enumerate(helpers.output_eleme):
+        toughio.write_h5(
+            filename=filename,
+            elements=output,
+            connections=helpers.output_conne[i],
+            compression=compression,
+            shuffle=shuffle,
+            layout="series",
+            append=i > 0,
+        )
+
+    with h5py.File(filename, "r") as f:
+        assert f["elements"]["PRES"].shape == (3, 10)
+        assert f["elements"]["PRES"].compression == compression
+        assert f["elements"]["PRES"].shuffle == shuffle
+
+    out = toughio.read_h5(filename)
+    for name, outputs_ref in zip(
+        ["elements", "connections"], [helpers.output_eleme, helpers.output_conne]
+    ):
+        assert len(outputs_ref) == len(out[name])
+        for out_ref, output in zip(outputs_ref, out[name]):
+            assert helpers.allclose(out_ref, output)
+
+    out = toughio.read_h5(filename, time_steps=-1, labels=["AAA03", "AAA01"])
+    assert helpers.allclose(helpers.output_eleme[-1][[3, 1]], out["elements"])
+
+    out = toughio.read_h5(
+        filename,
+        time_steps=[0, 2],
+        variables=["PRES"],
+        labels=["AAA03", "AAA01", "AAA03"],
+    )
+    for output, i in zip(out["elements"], [0, 2]):
+        assert list(output.data) == ["PRES"]
+        assert helpers.allclose(
+            helpers.output_eleme[i].data["PRES"][[3, 1, 3]], output.data["PRES"]
+        )
+
+    assert "PRES" not in out["connections"][0].data
+
+    with pytest.raises(ValueError):
+        toughio.write_h5(
+            filename=filename,
+            elements=helpers.output_eleme[0][[1, 2]],
+            layout="series",
+            append=True,
+        )
+
+
+def test_h5_compression_opts_positional():
+    filename = helpers.tempdir("output.h5")
+    toughio.write_h5(
+        filename, helpers.output_eleme, None, None, None, None, None, None, 9
+    )
+
+    with h5py.File(filename, "r") as f:
+        dataset = f["elements"]["time=0.0"]["PRES"]
+        assert dataset.compression == "gzip"
+        assert dataset.compression_opts == 9
@@ -1,3 +1,5 @@
+import os
+
 import helpers
 import numpy as np
 import pytest
@@ -927,3 +929,23 @@ def test_end_comments(write_read, single):
     parameters = write_read(parameters_ref)
 
     assert helpers.allclose(parameters_ref, parameters)
+
+
+def test_cache():
+    parameters_ref = {
+        "rocks": {
+            helpers.random_string(5): {"density": float(np.random.randint(1000))}
+            for _ in range(3)
+        },
+        "extra_options": {1: 2},
+    }
+
+    filename = helpers.tempdir("INFILE")
+    cache_dir = helpers.tempdir()
+    toughio.write_input(filename, parameters_ref)
+
+    for _ in range(2):
+        parameters = toughio.read_input(filename, cache_dir=cache_dir)
+
+        assert len(os.listdir(cache_dir)) == 1
+        assert helpers.allclose(parameters_ref, parameters)
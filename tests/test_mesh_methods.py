@@ -1,4 +1,5 @@
 import os
+import pickle
 import sys
 from copy import deepcopy
 
@@ -162,6 +163,58 @@ def test_read_output(filename, file_type, time_step):
         assert helpers.allclose(v, mesh.cell_data[k].mean())
 
 
+def test_read_output_connection():
+    mesh = toughio.meshmaker.structured_grid([1.0, 1.0, 1.0], [1.0], [1.0])
+    labels = mesh.labels
+    output = toughio.ConnectionOutput(
+        0.0,
+        {"FLOW": np.array([2.0, -3.0])},
+        [[labels[0], labels[1]], [labels[1], labels[2]]],
+    )
+    mesh.read_output(output)
+
+    # Flow vectors are accumulated in upstream cells
+    flow_ref = [[-2.0, 0.0, 0.0], [0.0, 0.0, 0.0], [3.0, 0.0, 0.0]]
+    assert helpers.allclose(flow_ref, mesh.cell_data["FLOW"])
+
+    output.labels = [["XXXXX", labels[0]], [labels[1], labels[2]]]
+    with pytest.raises(KeyError):
+        mesh.read_output(output)
+
+
+def test_cache():
+    mesh = toughio.meshmaker.structured_grid([1.0, 1.0], [1.0], [1.0])
+    connections = mesh.connections
+    face_normals = mesh.face_normals
+    assert helpers.allclose(mesh.face_normals, face_normals)
+
+    # Cached arrays are not altered by in-place operations
+    volumes = mesh.volumes
+    volumes *= 2.0
+    assert helpers.allclose(mesh.volumes, np.ones(2))
+
+    normals = mesh.face_normals
+    normals[0][0] *= 2.0
+    normals.pop()
+    assert helpers.allclose(mesh.face_normals, face_normals)
+
+    # Setting points invalidates cache
+    mesh.points = mesh.points * 2.0
+    assert helpers.allclose(mesh.volumes, np.full(2, 8.0))
+    assert helpers.allclose(mesh.connections, connections)
+
+    # In-place modifications require clearing cache
+    mesh.points[:] *= 0.5
+    assert helpers.allclose(mesh.volumes, np.full(2, 8.0))
+    mesh.clear_cache()
+    assert helpers.allclose(mesh.volumes, np.ones(2))
+
+    # Cache is not pickled
+    mesh = pickle.loads(pickle.dumps(mesh))
+    assert "_cache" not in mesh.__dict__
+    assert helpers.allclose(mesh.volumes, np.ones(2))
+
+
 def test_add_material():
     mesh = deepcopy(helpers.hybrid_mesh)
     mesh.add_material("a", 1)
@@ -239,6 +292,35 @@ def test_near():
     mesh = toughio.meshmaker.structured_grid(dx, dy, dz, origin=np.zeros(3))
 
     assert mesh.near((1.5, 1.5, 1.5)) == 13
+    assert helpers.allclose(mesh.near([[0.5, 0.5, 2.5], [2.5, 2.5, 0.5]]), [0, 26])
+
+    # k-nearest and radius queries
+    idx = mesh.near((1.5, 1.5, 1.5), k=7)
+    assert idx[0] == 13
+    assert sorted(idx[1:]) == [4, 10, 12, 14, 16, 22]
+
+    idx = mesh.near([(1.5, 1.5, 1.5), (-1.0, -1.0, -1.0)], radius=1.0)
+    assert idx[0][0] == 13
+    assert sorted(idx[0][1:]) == [4, 10, 12, 14, 16, 22]
+    assert len(idx[1]) == 0
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_grid_tree(ndim):
+    from toughio._mesh._spatial import GridTree
+
+    points = np.random.rand(1000, ndim)
+    tree = GridTree(points)
+
+    queries = np.random.rand(20, ndim) * 1.5 - 0.25
+    distances, idx = tree.query(queries, k=5)
+    for query, dist, i in zip(queries, distances, idx):
+        dist_ref = np.linalg.norm(points - query, axis=1)
+        assert helpers.allclose(dist, np.sort(dist_ref)[:5])
+        assert helpers.allclose(dist, dist_ref[i])
+
+        idx_ref = np.nonzero(dist_ref <= 0.1)[0]
+        assert sorted(tree.query_ball_point(query, 0.1)) == list(idx_ref)
 
 
 @pytest.mark.skipif(sys.version_info < (3, 6), reason="Order of keys in dictionary")
@@ -2,6 +2,7 @@ import os
 
 import helpers
 import numpy as np
+import pytest
 
 import toughio
 
@@ -32,3 +33,46 @@ def test_quality():
     mesh = toughio.meshmaker.structured_grid(dx, dy, dz, origin=np.zeros(3))
 
     assert helpers.allclose(mesh.qualities, np.ones(mesh.n_cells))
+
+
+def test_faces():
+    points = np.random.rand(10, 3)
+    cells = [
+        ("tetra", np.array([[0, 1, 2, 3]])),
+        ("wedge", np.array([[4, 5, 6, 7, 8, 9]])),
+    ]
+    mesh = toughio.Mesh(points, cells)
+
+    faces_ref = [
+        [[1, 2, 3, -1], [0, 3, 2, -1], [0, 1, 3, -1], [0, 2, 1, -1]]
+        + [[-1, -1, -1, -1]] * 2,
+        [
+            [4, 6, 5, -1],
+            [7, 8, 9, -1],
+            [4, 5, 8, 7],
+            [5, 6, 9, 8],
+            [4, 7, 9, 6],
+            [-1, -1, -1, -1],
+        ],
+    ]
+    assert helpers.allclose(mesh.faces, faces_ref)
+    assert [len(face) for face in mesh.face_areas] == [4, 5]
+
+
+def test_adjacency():
+    pytest.importorskip("scipy")
+
+    dx = np.ones(3)
+    dy = np.ones(2)
+    dz = np.ones(2)
+    mesh = toughio.meshmaker.structured_grid(dx, dy, dz, origin=np.zeros(3))
+    adjacency = mesh.adjacency.toarray()
+
+    connections = mesh.connections
+    for i, connection in enumerate(connections):
+        assert sorted(j for j in connection if j >= 0) == list(
+            np.nonzero(adjacency[i])[0]
+        )
+
+    assert helpers.allclose(adjacency, adjacency.T)
+    assert adjacency.sum() == 2 * (2 * 2 * 2 + 3 * 2 + 3 * 2)
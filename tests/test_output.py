@@ -1,3 +1,4 @@
+import io
 import os
 
 import helpers
@@ -90,6 +91,78 @@ def test_output_conne(filename):
         assert helpers.allclose(data, np.abs(output.data["HEAT"]).mean(), atol=1.0)
 
 
+@pytest.mark.parametrize(
+    "filename, connection",
+    [
+        ("OUTPUT.out", False),
+        ("OUTPUT.out", True),
+        ("OUTPUT_6.out", False),
+        ("OUTPUT_6.out", True),
+    ],
+)
+def test_output_engine(filename, connection):
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    filename = os.path.join(this_dir, "support_files", "outputs", filename)
+    outputs_ref = toughio.read_output(filename, connection=connection)
+    outputs = toughio.read_output(filename, connection=connection, engine="fast")
+
+    assert len(outputs_ref) == len(outputs)
+    for out_ref, out in zip(outputs_ref, outputs):
+        assert out_ref.time == out.time
+        assert list(out_ref.labels) == list(out.labels)
+        assert list(out_ref.data) == list(out.data)
+        assert helpers.allclose(out.data, out_ref.data)
+
+
+@pytest.mark.parametrize(
+    "connection, time_steps",
+    [
+        (False, None),
+        (False, [0, -1]),
+        (True, None),
+        (True, [0, -1]),
+    ],
+)
+def test_output_lazy(connection, time_steps):
+    this_dir = os.path.dirname(os.path.abspath(__file__))
+    filename = os.path.join(this_dir, "support_files", "outputs", "OUTPUT.out")
+    outputs_ref = toughio.read_output(
+        filename, time_steps=time_steps, connection=connection
+    )
+    outputs = toughio.read_output(
+        filename, time_steps=time_steps, connection=connection, lazy=True
+    )
+
+    with outputs:
+        assert len(outputs_ref) == len(outputs)
+        assert helpers.allclose([out.time for out in outputs_ref], outputs.times)
+        for out_ref, out in zip(outputs_ref, outputs):
+            assert out_ref.time == out.time
+            assert list(out_ref.data) == list(out.data)
+            assert helpers.allclose(out.data, out_ref.data)
+
+    with pytest.raises(ValueError):
+        outputs[0]
+
+
+def test_lazy_output_close():
+    closed = []
+    outputs = toughio._io.output._common.LazyOutput(
+        lambda i: helpers.output_eleme[i],
+        [out.time for out in helpers.output_eleme],
+        close=lambda: closed.append(True),
+    )
+
+    with outputs:
+        assert outputs[-1] is helpers.output_eleme[-1]
+
+    outputs.close()
+    assert closed == [True]
+
+    with pytest.raises(ValueError):
+        outputs[-1]
+
+
 @pytest.mark.parametrize(
     "output_ref, file_format",
     [
@@ -118,33 +191,257 @@ def test_output(output_ref, file_format):
 
 
 @pytest.mark.parametrize(
-    "filename",
+    "output_ref, file_format, time_steps",
+    [
+        (helpers.output_eleme, "csv", None),
+        (helpers.output_eleme, "tecplot", None),
+        (helpers.output_eleme, "tecplot", [0, -1]),
+        (helpers.output_conne, "csv", [0, -1]),
+    ],
+)
+def test_output_workers(output_ref, file_format, time_steps):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    outputs_ref = toughio.read_output(filename, time_steps=time_steps)
+    outputs = toughio.read_output(filename, time_steps=time_steps, workers=2)
+
+    assert len(outputs_ref) == len(outputs)
+    for out_ref, out in zip(outputs_ref, outputs):
+        assert helpers.allclose(out, out_ref)
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format, variables",
+    [
+        (helpers.output_eleme, "csv", ["Z", "X"]),
+        (helpers.output_eleme, "petrasim", ["Y"]),
+        (helpers.output_eleme, "tecplot", ["Z"]),
+        (helpers.output_eleme, "tecplot", ["X", "Z"]),
+        (helpers.output_conne, "csv", ["Y"]),
+    ],
+)
+def test_output_variables(output_ref, file_format, variables):
+    output = write_read(
+        output=output_ref,
+        writer_kws={"file_format": file_format},
+        reader_kws={"variables": variables},
+    )
+
+    for out_ref, out in zip(output_ref, output):
+        assert variables == list(out.data)
+        for k, v in out.data.items():
+            assert helpers.allclose(out_ref.data[k], v)
+
+    with pytest.raises(ValueError):
+        write_read(
+            output=output_ref,
+            writer_kws={"file_format": file_format},
+            reader_kws={"variables": ["UNKNOWN"]},
+        )
+
+
+@pytest.mark.parametrize(
+    "filename, connection",
     [
-        "OUTPUT_ELEME.csv",
-        "OUTPUT_ELEME.tec",
-        "OUTPUT_ELEME_PETRASIM.csv",
-        "OUTPUT.out",
-        "OUTPUT_CONNE.csv",
+        ("OUTPUT_ELEME.csv", False),
+        ("OUTPUT_ELEME.tec", False),
+        ("OUTPUT_ELEME_PETRASIM.csv", False),
+        ("OUTPUT.out", False),
+        ("OUTPUT.out", True),
+        ("OUTPUT_CONNE.csv", False),
     ],
 )
-def test_output_time_steps(filename):
+def test_output_time_steps(filename, connection):
     this_dir = os.path.dirname(os.path.abspath(__file__))
     filename = os.path.join(this_dir, "support_files", "outputs", filename)
-    outputs_ref = toughio.read_output(filename)
+    outputs_ref = toughio.read_output(filename, connection=connection)
 
     time_steps = [0, 2, -1]
-    outputs = toughio.read_output(filename, time_steps=time_steps)
+    outputs = toughio.read_output(
+        filename, time_steps=time_steps, connection=connection
+    )
     outputs_ref = [outputs_ref[time_step] for time_step in time_steps]
 
     for out_ref, out in zip(outputs_ref, outputs):
         helpers.allclose(out, out_ref)
 
 
+@pytest.mark.parametrize(
+    "file_format, time_steps",
+    [
+        ("tecplot", [1]),
+        ("tecplot", [-1, 0]),
+        ("tecplot", [0, 2, 10]),
+    ],
+)
+def test_output_time_steps_index(file_format, time_steps):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, helpers.output_eleme, file_format=file_format)
+
+    outputs = toughio.read_output(filename, time_steps=time_steps)
+    outputs = outputs if isinstance(outputs, list) else [outputs]
+    time_steps_ = sorted(
+        i if i >= 0 else i + len(helpers.output_eleme)
+        for i in time_steps
+        if i < len(helpers.output_eleme)
+    )
+
+    assert len(outputs) == len(time_steps_)
+    for time_step, out in zip(time_steps_, outputs):
+        out_ref = helpers.output_eleme[time_step]
+        assert out_ref.time == out.time
+        for k, v in out.data.items():
+            assert helpers.allclose(out_ref.data[k], v)
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format, variables",
+    [
+        (helpers.output_eleme, "csv", None),
+        (helpers.output_eleme, "petrasim", ["X"]),
+        (helpers.output_eleme, "tecplot", None),
+        (helpers.output_conne, "csv", ["Z"]),
+    ],
+)
+def test_iter_output(output_ref, file_format, variables):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    outputs = list(toughio.iter_output(filename, variables=variables))
+    time_steps = [0, -1]
+    outputs_ts = list(toughio.iter_output(filename, time_steps=time_steps))
+
+    assert len(outputs) == len(output_ref)
+    for out_ref, out in zip(output_ref, outputs):
+        assert out_ref.time == out.time
+        assert sorted(variables if variables else out_ref.data) == sorted(out.data)
+        for k, v in out.data.items():
+            assert helpers.allclose(out_ref.data[k], v)
+
+    assert len(outputs_ts) == len(time_steps)
+    for time_step, out in zip(time_steps, outputs_ts):
+        assert helpers.allclose(out, output_ref[time_step])
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format",
+    [
+        (helpers.output_eleme, "csv"),
+        (helpers.output_eleme, "tecplot"),
+        (helpers.output_conne, "csv"),
+    ],
+)
+def test_output_cache(output_ref, file_format):
+    filename = helpers.tempdir(helpers.random_string(10))
+    cache_dir = helpers.tempdir()
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    outputs_ref = toughio.read_output(filename)
+    for _ in range(2):
+        outputs = toughio.read_output(filename, cache_dir=cache_dir)
+
+        assert len(os.listdir(cache_dir)) == 1
+        assert len(outputs_ref) == len(outputs)
+        for out_ref, out in zip(outputs_ref, outputs):
+            assert out_ref.time == out.time
+            assert list(out_ref.data) == list(out.data)
+            assert helpers.allclose(out, out_ref)
+
+    # Labels are cached once and time steps loaded from cache share the label index
+    (path,) = os.listdir(cache_dir)
+    n_labels = sum(
+        f.startswith("labels_") for f in os.listdir(os.path.join(cache_dir, path))
+    )
+    assert n_labels == (0 if file_format == "tecplot" else 1)
+    if n_labels:
+        assert all(out._label_index is outputs[0]._label_index for out in outputs)
+        assert outputs[-1].labels is not outputs[0].labels
+
+    outputs = toughio.read_output(filename, time_steps=-1, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+    assert helpers.allclose(outputs, outputs_ref[-1])
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format",
+    [
+        (helpers.output_eleme, "csv"),
+        (helpers.output_eleme, "petrasim"),
+        (helpers.output_eleme, "tecplot"),
+        (helpers.output_conne, "csv"),
+    ],
+)
+def test_output_buffer(output_ref, file_format):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    with open(filename, "r") as f:
+        buffer = f.read()
+
+    # Format is guessed from the buffer and time steps are counted without consuming it
+    for time_steps in [None, -1]:
+        outputs_ref = toughio.read_output(filename, time_steps=time_steps)
+        outputs = toughio.read_output(io.StringIO(buffer), time_steps=time_steps)
+        assert helpers.allclose(outputs, outputs_ref)
+
+
+@pytest.mark.parametrize(
+    "file_format, times, time_range, times_ref",
+    [
+        ("csv", 0.4, None, [0.0]),
+        ("csv", [1.6, 0.4], None, [0.0, 2.0]),
+        ("petrasim", None, (0.5, None), [1.0, 2.0]),
+        ("tecplot", None, (None, 1.0), [0.0, 1.0]),
+        ("tecplot", 100.0, None, [2.0]),
+    ],
+)
+def test_output_times(file_format, times, time_range, times_ref):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, helpers.output_eleme, file_format=file_format)
+
+    outputs = toughio.read_output(
+        filename, file_format=file_format, times=times, time_range=time_range
+    )
+    outputs = outputs if isinstance(outputs, list) else [outputs]
+    assert times_ref == [out.time for out in outputs]
+
+    outputs = toughio.iter_output(
+        filename, file_format=file_format, times=times, time_range=time_range
+    )
+    assert times_ref == [out.time for out in outputs]
+
+    with pytest.raises(ValueError):
+        toughio.read_output(filename, file_format=file_format, time_range=(10.0, 20.0))
+
+    with pytest.raises(ValueError):
+        toughio.read_output(filename, file_format=file_format, time_steps=0, times=0.0)
+
+
+def test_output_duplicate_connections():
+    labels = [["AAA 0", "AAA 1"], ["AAA 1", "AAA 2"], ["AAA 0", "AAA 1"]]
+    outputs = [
+        toughio.ConnectionOutput(float(i), {"FLOW": np.arange(3.0) + i}, labels)
+        for i in range(2)
+    ]
+
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, outputs, file_format="csv")
+    outputs = toughio.read_output(filename)
+
+    for i, output in enumerate(outputs):
+        assert output.labels == labels[:2]
+        assert helpers.allclose(output.data["FLOW"], [2.0 + 2 * i, 1.0 + i])
+
+
 def test_save():
     this_dir = os.path.dirname(os.path.abspath(__file__))
     filename = os.path.join(this_dir, "support_files", "outputs", "SAVE.out")
     save = toughio.read_output(filename)
 
+    variables = ["porosity", "X1"]
+    assert variables == list(toughio.read_output(filename, variables=variables).data)
+
     x_ref = [6.35804123e05, 1.42894499e02, 9.91868799e-01]
     assert helpers.allclose(
         x_ref, np.mean([save.data["X1"], save.data["X2"], save.data["X3"]], axis=1)
@@ -155,6 +452,45 @@ def test_save():
     assert "userx" not in save.data
 
 
+@pytest.mark.parametrize(
+    "n_variables, userx",
+    [(3, None), (6, None), (4, [1.0, 2.0])],
+)
+def test_save_incon(n_variables, userx):
+    initial_conditions = {
+        helpers.random_string(5): {
+            "porosity": np.random.rand(),
+            "values": np.random.rand(n_variables).tolist(),
+            **({"userx": userx} if userx else {}),
+        }
+        for _ in range(10)
+    }
+    parameters = {
+        "initial_conditions": initial_conditions,
+        "end_comments": ["+++", "    1    2    0  1.0e+07"],
+    }
+
+    filename = helpers.tempdir("SAVE")
+    toughio.write_input(filename, parameters, block="incon")
+    save = toughio.read_output(filename, file_format="save")
+
+    assert save.time == 1.0e7
+    assert list(save.labels) == list(initial_conditions)
+    assert helpers.allclose(
+        save.data["porosity"], [v["porosity"] for v in initial_conditions.values()]
+    )
+
+    for i in range(n_variables):
+        x_ref = [v["values"][i] for v in initial_conditions.values()]
+        assert helpers.allclose(save.data[f"X{i + 1}"], x_ref, atol=1.0e-6)
+
+    if userx:
+        assert helpers.allclose(save.data["userx"], [userx] * len(initial_conditions))
+
+    else:
+        assert "userx" not in save.data
+
+
 @pytest.mark.parametrize(
     "output_ref, islice",
     [
@@ -191,3 +527,244 @@ def test_getitem(output_ref, islice):
     else:
         for k, v in output.items():
             assert np.allclose(v, output_ref.data[k][idx[0]])
+
+
+@pytest.mark.parametrize(
+    "output_ref, label, label_ref",
+    [
+        (helpers.output_eleme[0], ["AAA03"], 3),
+        (helpers.output_conne[0], ["AAA03", "AAA03"], 3),
+        (helpers.output_conne[0], ["AAA04AAA04"], 4),
+    ],
+)
+def test_index(output_ref, label, label_ref):
+    output = type(output_ref)(output_ref.time, output_ref.data, output_ref.labels)
+    assert label_ref == output.index(*label)
+
+    # Label index is invalidated when labels are changed
+    output.labels = output.labels[::-1]
+    assert output.n_data - label_ref - 1 == output.index(*label)
+
+    with pytest.raises(ValueError):
+        output.index("UNKNOWN")
+
+
+@pytest.mark.parametrize(
+    "output_ref",
+    [helpers.output_eleme, helpers.output_conne],
+)
+def test_time_series_output(output_ref):
+    outputs = write_read(
+        output=output_ref,
+        writer_kws={"file_format": "csv"},
+        reader_kws={},
+    )
+
+    assert isinstance(outputs, toughio.TimeSeriesOutput)
+    assert helpers.allclose([out.time for out in output_ref], outputs.times)
+
+    # Time steps own their labels but share the label index
+    label, key = outputs.labels[0], outputs[0]._key(0)
+    for out in outputs:
+        assert out.labels == outputs[0].labels
+        assert out.labels is not outputs[0].labels or out is outputs[0]
+        assert out._label_index is outputs[0]._label_index
+
+    outputs[0].labels[0] = "NEW00" if isinstance(label, str) else ["NEW00", "NEW01"]
+    assert outputs[0].index(outputs[0]._key(0)) == 0
+    assert outputs[-1].labels[0] == label
+    assert outputs[-1].index(key) == 0
+    with pytest.raises(ValueError):
+        outputs[0].index(key)
+
+    # Input outputs are not modified
+    inputs = [type(out)(out.time, out.data, out.labels) for out in output_ref]
+    labels = [out.labels for out in inputs]
+    outputs = toughio.TimeSeriesOutput(inputs)
+    assert all(out.labels is label for out, label in zip(outputs, labels))
+    assert outputs.labels == outputs[0].labels
+
+    outputs[-1].labels = outputs[-1].labels[::-1]
+    assert outputs.labels is None
+
+
+@pytest.mark.parametrize(
+    "output_ref",
+    [helpers.output_eleme, helpers.output_conne],
+)
+def test_output_series(output_ref):
+    series = toughio.OutputSeries.from_output(output_ref)
+
+    assert series.data.shape == (3, 10, 5)
+    assert helpers.allclose(series.times, [out.time for out in output_ref])
+    for out_ref, out in zip(output_ref, series.to_output()):
+        assert helpers.allclose(out, out_ref)
+
+    # History
+    label = "AAA03" if isinstance(series.labels[0], str) else "AAA03AAA03"
+    k = series.variables[3]
+    history = series[k, label]
+    assert helpers.allclose(history, [out.data[k][3] for out in output_ref])
+
+    # Interpolation
+    out = series.interpolate(0.25)
+    for k, v in out.data.items():
+        assert helpers.allclose(
+            v, 0.75 * output_ref[0].data[k] + 0.25 * output_ref[1].data[k]
+        )
+
+    out = series.interpolate([-1.0, 5.0], variables=["X"])
+    assert helpers.allclose(out["X"][0], output_ref[0].data["X"])
+    assert helpers.allclose(out["X"][1], output_ref[-1].data["X"])
+
+    # Reductions
+    assert helpers.allclose(
+        series.mean()["Y"], np.mean([out.data["Y"] for out in output_ref], axis=0)
+    )
+    assert helpers.allclose(
+        series.max(axis=1)["Z"], [out.data["Z"].max() for out in output_ref]
+    )
+
+    # Unsorted time steps
+    order = [2, 0, 1]
+    series = toughio.OutputSeries.from_output(iter([output_ref[i] for i in order]))
+    assert helpers.allclose(series.times, [output_ref[i].time for i in order])
+
+    out = series.interpolate([0.25, 1.5])
+    for k in out.variables:
+        assert helpers.allclose(
+            out[k][0], 0.75 * output_ref[0].data[k] + 0.25 * output_ref[1].data[k]
+        )
+        assert helpers.allclose(
+            out[k][1], 0.5 * output_ref[1].data[k] + 0.5 * output_ref[2].data[k]
+        )
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format",
+    [
+        (helpers.output_eleme, "csv"),
+        (helpers.output_conne, "csv"),
+        (helpers.output_eleme, "tecplot"),
+    ],
+)
+def test_read_output_series(output_ref, file_format):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    connection = isinstance(output_ref[0], toughio.ConnectionOutput)
+    series = toughio.read_output(filename, connection=connection, series=True)
+    series_ref = toughio.OutputSeries.from_output(
+        toughio.read_output(filename, connection=connection)
+    )
+
+    assert isinstance(series, toughio.OutputSeries)
+    assert series.variables == series_ref.variables
+    assert series.labels == series_ref.labels
+    assert helpers.allclose(series.times, series_ref.times)
+    assert helpers.allclose(series.data, series_ref.data)
+
+    series = toughio.read_output(
+        filename, connection=connection, time_steps=[0, -1], series=True
+    )
+    assert helpers.allclose(series.data, series_ref.data[[0, -1]])
+
+    with pytest.raises(ValueError):
+        toughio.read_output(filename, series=True, workers=2)
+
+
+@pytest.mark.parametrize(
+    "output_ref, file_format",
+    [
+        (helpers.output_eleme, "csv"),
+        (helpers.output_conne, "csv"),
+        (helpers.output_eleme, "tecplot"),
+    ],
+)
+def test_output_follower(output_ref, file_format):
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref, file_format=file_format)
+
+    with open(filename, "rb") as f:
+        content = f.read()
+
+    # Simulate a file growing by chunks of bytes
+    filename = helpers.tempdir(helpers.random_string(10))
+    follower = toughio.OutputFollower(filename)
+    assert not follower.poll()
+
+    # First bytes are written one at a time to check partially written headers
+    outputs = []
+    chunks = list(range(100)) + list(range(100, len(content), 50))
+    for i, j in zip(chunks, chunks[1:] + [len(content)]):
+        with open(filename, "ab") as f:
+            f.write(content[i:j])
+
+        outputs += follower.poll()
+
+    outputs += follower.flush()
+    assert len(output_ref) == len(outputs) == follower.n_time_steps
+    for out_ref, out in zip(output_ref, outputs):
+        assert helpers.allclose(out, out_ref)
+
+    # Single time step is returned once the file is no longer written
+    filename = helpers.tempdir(helpers.random_string(10))
+    toughio.write_output(filename, output_ref[0], file_format=file_format)
+    follower = toughio.OutputFollower(filename)
+    outputs = follower.poll() + follower.flush()
+
+    assert len(outputs) == 1
+    assert helpers.allclose(outputs[0], output_ref[0])
+    assert not follower.flush()
+
+
+def test_output_follower_partial_header():
+    # Incomplete first line of a standard TOUGH output file
+    filename = helpers.tempdir(helpers.random_string(10))
+    follower = toughio.OutputFollower(filename)
+    for char in "1      @@@@@@@@@@@@@@@@@@@@\n\n":
+        with open(filename, "a") as f:
+            f.write(char)
+
+        assert not follower.poll()
+
+    assert follower._file_format == "tough"
+
+
+def test_tecplot_invalid_values():
+    filename = helpers.tempdir(helpers.random_string(10))
+    with open(filename, "w") as f:
+        f.write(" VARIABLES = X Y PRES\n")
+        f.write(' ZONE T=" 1.0e+01 SEC"  I = 2\n')
+        f.write(" 1.0 2.0 3.0-100\n 4.0 5.0 6.0\n")
+        f.write(' ZONE T=" 2.0e+01 SEC"  I = 1\n')
+        f.write(" 1.0 2.0-100 3.0\n")
+
+    outputs = toughio.read_output(filename, file_format="tecplot")
+
+    assert helpers.allclose(outputs[0].data["X"], [1.0, 4.0])
+    assert np.isnan(outputs[0].data["PRES"][0])
+    assert helpers.allclose(outputs[1].data["PRES"], [3.0])
+    assert np.isnan(outputs[1].data["Y"][0])
+
+
+def test_tecplot_lowercase_zone():
+    filename = helpers.tempdir(helpers.random_string(10))
+    with open(filename, "w") as f:
+        f.write(" VARIABLES = X Y PRES\n")
+        f.write(' zone T=" 1.0e+01 SEC"  I = 1\n')
+        f.write(" 1.0 2.0 3.0\n")
+        f.write('   Zone T=" 2.0e+01 SEC"  I = 1\n')
+        f.write(" 4.0 5.0 6.0\n")
+
+    outputs = toughio.read_output(filename, file_format="tecplot")
+    assert len(outputs) == 2
+
+    output = toughio.read_output(filename, file_format="tecplot", times=20.0)
+    assert helpers.allclose(output.data["PRES"], [6.0])
+
+    outputs = toughio.read_output(filename, file_format="tecplot", workers=2)
+    assert helpers.allclose(outputs.times, [10.0, 20.0])
+
+    follower = toughio.OutputFollower(filename, file_format="tecplot")
+    assert helpers.allclose(follower.poll().times, [10.0, 20.0])
@@ -119,6 +119,53 @@ def test_mesh(nodal_distance, bound, coord):
         assert helpers.allclose(distances_ref, np.sum(distances))
 
 
+def test_mesh_hybrid():
+    # Two tetrahedra and two wedges sharing triangular and quadrangular faces
+    points = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 0.0, 1.0],
+            [1.0, 0.0, 1.0],
+            [0.0, 1.0, 1.0],
+            [0.0, 0.0, -1.0],
+            [0.0, 0.0, 2.0],
+            [0.0, -1.0, 0.0],
+            [0.0, -1.0, 1.0],
+        ]
+    )
+    cells = [
+        ("tetra", np.array([[0, 1, 2, 6], [3, 4, 5, 7]])),
+        ("wedge", np.array([[0, 1, 2, 3, 4, 5], [0, 8, 1, 3, 9, 4]])),
+    ]
+    mesh = toughio.Mesh(points, cells)
+
+    parameters = helpers.write_read(
+        filename="MESH",
+        obj=None,
+        writer=mesh.write_tough,
+        reader=toughio.read_mesh,
+        writer_kws={"nodal_distance": "orthogonal"},
+        reader_kws={"file_format": "tough"},
+    )
+
+    labels = mesh.labels
+    connections = parameters["connections"]
+    assert list(connections) == [
+        labels[0] + labels[2],
+        labels[1] + labels[2],
+        labels[2] + labels[3],
+    ]
+
+    areas = [connection["interface_area"] for connection in connections.values()]
+    assert helpers.allclose(areas, [0.5, 0.5, 1.0])
+
+    distances = [connection["nodal_distances"] for connection in connections.values()]
+    distances_ref = [[0.25, 0.5], [0.25, 0.5], [1.0 / 3.0, 1.0 / 3.0]]
+    assert helpers.allclose(distances, distances_ref, atol=1.0e-4)
+
+
 @pytest.mark.parametrize("anisotropic", [True, False, None])
 def test_incon(anisotropic):
     # Create 3D mesh
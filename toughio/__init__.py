@@ -4,6 +4,11 @@ from ._helpers import convert_labels
 from ._io import (
     ConnectionOutput,
     ElementOutput,
+    OutputFollower,
+    OutputSeries,
+    TimeSeriesOutput,
+    iter_output,
+    read_h5,
     read_input,
     read_output,
     read_table,
@@ -27,6 +32,9 @@ __all__ = [
     "CellBlock",
     "ElementOutput",
     "ConnectionOutput",
+    "TimeSeriesOutput",
+    "OutputSeries",
+    "OutputFollower",
     "meshmaker",
     "register_input",
     "register_output",
@@ -34,7 +42,9 @@ __all__ = [
     "register_table",
     "read_input",
     "read_output",
+    "iter_output",
     "read_table",
+    "read_h5",
     "write_h5",
     "write_input",
     "write_output",
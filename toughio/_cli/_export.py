@@ -320,7 +320,7 @@ def _get_points(output, ignore_elements):
     if ignore_elements:
         mask = np.ones(n_points, dtype=bool)
         for element in ignore_elements:
-            mask = np.logical_and(mask, output.labels != element)
+            mask = np.logical_and(mask, np.asarray(output.labels) != element)
 
         X = X[mask]
         Y = Y[mask]
@@ -1,8 +1,16 @@
+from .h5 import read as read_h5
 from .h5 import write as write_h5
 from .input import read as read_input
 from .input import register as register_input
 from .input import write as write_input
-from .output import ConnectionOutput, ElementOutput
+from .output import (
+    ConnectionOutput,
+    ElementOutput,
+    OutputFollower,
+    OutputSeries,
+    TimeSeriesOutput,
+)
+from .output import iterate as iter_output
 from .output import read as read_output
 from .output import register as register_output
 from .output import write as write_output
@@ -12,12 +20,17 @@ from .table import register as register_table
 __all__ = [
     "ElementOutput",
     "ConnectionOutput",
+    "TimeSeriesOutput",
+    "OutputSeries",
+    "OutputFollower",
     "register_input",
     "register_output",
     "read_input",
+    "read_h5",
     "write_h5",
     "write_input",
     "read_output",
+    "iter_output",
     "write_output",
     "read_table",
     "register_table",
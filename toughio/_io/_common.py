@@ -1,3 +1,7 @@
+import hashlib
+import json
+import os
+
 import numpy as np
 
 
@@ -57,6 +61,47 @@ def to_float(s):
         return float(f"{significand}e{exponent}")
 
 
+def to_float_array(x):
+    """
+    Convert fixed-width strings to floats.
+
+    Parameters
+    ----------
+    x : array_like
+        Array of ASCII character codes. Each string is stored along the last axis.
+
+    Returns
+    -------
+    array_like
+        Converted values. Blank strings are converted to NaN.
+
+    """
+    x = np.array(x, dtype=np.uint8)
+    shape, width = x.shape[:-1], x.shape[-1]
+    x = x.reshape((-1, width))
+
+    # Replace Fortran double precision exponent
+    x[(x == ord("d")) | (x == ord("D"))] = ord("e")
+
+    # Values with an exponent missing the "e" are probably something like "0.0001-001"
+    # Those are converted one by one, others are converted at once
+    s = x.view(f"S{width}")[:, 0]
+    digit = (x >= ord("0")) & (x <= ord("9"))
+    sign = (x == ord("-")) | (x == ord("+"))
+    exponent = (x == ord("e")) | (x == ord("E"))
+    mask = ~(digit[:, :-1] & sign[:, 1:]).any(axis=1) | exponent.any(axis=1)
+    mask &= (x != ord(" ")).any(axis=1)
+
+    out = np.full(len(s), np.nan)
+    out[mask] = s[mask].astype(np.float64)
+    for i in np.flatnonzero(~mask):
+        tmp = s[i].decode().strip()
+        if tmp:
+            out[i] = to_float(tmp)
+
+    return out.reshape(shape)
+
+
 def to_str(x, fmt, space_between_values=False):
     """Convert variable to string."""
     x = "" if x is None else x
@@ -113,3 +158,24 @@ def scientific_notation(x, n):
 
     else:
         return tmp
+
+
+def get_cache_path(filename, cache_dir, *args):
+    """
+    Return path of cache entry of a file.
+
+    The key of the entry depends on the path, size and modification time of the file,
+    and on the reading options `args`. Return None for buffers.
+
+    """
+    if not isinstance(filename, (str, os.PathLike)):
+        return None
+
+    stat = os.stat(filename)
+    key = json.dumps(
+        [os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, *args],
+        default=lambda x: np.asarray(x).tolist(),
+        sort_keys=True,
+    )
+
+    return os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest())
@@ -1,5 +1,7 @@
+from ._read import read
 from ._write import write
 
 __all__ = [
+    "read",
     "write",
 ]
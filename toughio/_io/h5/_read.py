@@ -0,0 +1,242 @@
+import h5py
+import numpy as np
+
+from ..output import ConnectionOutput, ElementOutput, TimeSeriesOutput
+from ..output._common import get_label_index, get_time_steps
+
+
+def read(filename, time_steps=None, variables=None, labels=None, lazy=False):
+    """
+    Read TOUGH outputs from a HDF5 file.
+
+    Parameters
+    ----------
+    filename : str or pathlike
+        Input file name.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    labels : sequence of str or None, optional, default None
+        Labels of elements to read (only applied to element outputs). If None, all
+        elements will be read.
+    lazy : bool, optional, default False
+        If `True`, data are returned as :class:`h5py.Dataset` that are only read when
+        sliced (the file is kept open until the returned object is closed). Not applied
+        to element data if `labels` is not None, nor to outputs written with
+        ``layout = "series"``.
+
+    Returns
+    -------
+    dict
+        Outputs and tables written by :func:`toughio.write_h5`. Elements and
+        connections outputs are returned as :class:`toughio.ElementOutput`,
+        :class:`toughio.ConnectionOutput` or :class:`toughio.TimeSeriesOutput`. The
+        returned dictionary has a method `close` to close the file (if `lazy` is
+        `True`) and can be used as a context manager.
+
+    Note
+    ----
+    Variables are selected separately for element and connection outputs, and
+    variables missing from one of them are ignored for this output.
+
+    """
+    if isinstance(variables, str):
+        variables = [variables]
+
+    f = h5py.File(filename, "r")
+
+    try:
+        out = H5Output(f if lazy else None)
+        names = set()
+
+        for name, group in f.items():
+            if name in {"elements", "connections"}:
+                names.update(_get_variables(group))
+                out[name] = _read_output(
+                    group,
+                    name == "connections",
+                    time_steps,
+                    variables,
+                    labels if name == "elements" else None,
+                    lazy,
+                )
+
+            else:
+                out[name] = _read_table(group, lazy)
+
+        if variables is not None and names:
+            missing = [variable for variable in variables if variable not in names]
+            if missing:
+                raise ValueError(f"Unknown variable(s): {', '.join(missing)}.")
+
+    except Exception:
+        f.close()
+        raise
+
+    if not lazy:
+        f.close()
+
+    return out
+
+
+class H5Output(dict):
+    def __init__(self, f=None):
+        """
+        Outputs and tables read from a HDF5 file.
+
+        Parameters
+        ----------
+        f : :class:`h5py.File` or None, optional, default None
+            File kept open for lazy reading.
+
+        """
+        super().__init__()
+        self._file = f
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close file on exit."""
+        self.close()
+
+    def close(self):
+        """Close file (lazy datasets can no longer be read)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _read_output(f, connection, time_steps, variables, labels, lazy):
+    """Read TOUGH output from group."""
+    if isinstance(f.get("time"), h5py.Dataset):
+        return _read_output_series(f, connection, time_steps, variables, labels)
+
+    # Sort time steps by time (groups are sorted by name)
+    groups = sorted(f.items(), key=lambda x: float(x[0].split("=")[1]))
+    time_steps = get_time_steps(time_steps, lambda: len(groups))
+
+    if time_steps is not None:
+        groups = [groups[i] for i in sorted(time_steps) if 0 <= i < len(groups)]
+
+    outputs = []
+    for name, group in groups:
+        labels_ = np.asarray(_read_dataset(group["labels"]), dtype=str)
+        headers = _get_headers([k for k in group if k != "labels"], variables)
+
+        if labels is not None:
+            index = get_label_index(labels_)
+
+            try:
+                idx = [index[label] for label in labels]
+
+            except KeyError as e:
+                raise ValueError(f"{e} is not in list")
+
+            labels_ = labels_[idx]
+            data = {k: group[k][()][idx] for k in headers}
+
+        else:
+            data = {k: _read_dataset(group[k], lazy) for k in headers}
+
+        output = ConnectionOutput if connection else ElementOutput
+        outputs.append(output(float(name.split("=")[1]), data, labels_))
+
+    outputs = TimeSeriesOutput(outputs)
+
+    return outputs[0] if len(outputs) == 1 else outputs
+
+
+def _read_output_series(f, connection, time_steps, variables, labels):
+    """Read TOUGH output from group with one time series dataset per variable."""
+    times = f["time"][()]
+    labels_ = np.asarray(_read_dataset(f["labels"]), dtype=str)
+    headers = _get_headers(_get_variables(f), variables)
+
+    # Select time steps (rows)
+    time_steps = get_time_steps(time_steps, lambda: len(times))
+    rows = (
+        [i for i in sorted(time_steps) if 0 <= i < len(times)]
+        if time_steps is not None
+        else slice(None)
+    )
+
+    # Select elements (columns)
+    cols = slice(None)
+
+    if labels is not None:
+        index = get_label_index(labels_)
+
+        try:
+            cols = [index[label] for label in labels]
+
+        except KeyError as e:
+            raise ValueError(f"{e} is not in list")
+
+        labels_ = labels_[cols]
+
+    data = {k: _read_selection(f[k], rows, cols) for k in headers}
+
+    output = ConnectionOutput if connection else ElementOutput
+    outputs = TimeSeriesOutput(
+        output(float(time), {k: v[i] for k, v in data.items()}, labels_)
+        for i, time in enumerate(times[rows])
+    )
+
+    return outputs[0] if len(outputs) == 1 else outputs
+
+
+def _read_selection(dataset, rows, cols):
+    """Read selected rows and columns of a 2D dataset (other values are not read)."""
+    if isinstance(cols, slice):
+        return dataset[rows]
+
+    # h5py requires increasing indices and only one index list per selection
+    ucols, inverse = np.unique(cols, return_inverse=True)
+    ucols = ucols.tolist()
+
+    if isinstance(rows, slice):
+        data = dataset[rows, ucols]
+
+    else:
+        data = np.empty((len(rows), len(ucols)), dtype=dataset.dtype)
+        for i, row in enumerate(rows):
+            data[i] = dataset[row, ucols]
+
+    return data[:, inverse.ravel()]
+
+
+def _get_variables(f):
+    """Return names of variables in output group."""
+    if isinstance(f.get("time"), h5py.Dataset):
+        return [k for k in f if k not in {"time", "labels"}]
+
+    group = next(iter(f.values()), None)
+
+    return [k for k in group if k != "labels"] if group is not None else []
+
+
+def _get_headers(headers, variables):
+    """Select variables in headers (variables not in headers are ignored)."""
+    if variables is None:
+        return headers
+
+    return [variable for variable in variables if variable in headers]
+
+
+def _read_table(f, lazy):
+    """Read TOUGH tables from group."""
+    return {
+        name: {k: _read_dataset(v, lazy) for k, v in group.items()}
+        for name, group in f.items()
+    }
+
+
+def _read_dataset(dataset, lazy=False):
+    """Read dataset (strings are decoded)."""
+    if h5py.check_string_dtype(dataset.dtype) is not None:
+        return dataset.asstr()[()]
+
+    return dataset if lazy else dataset[()]
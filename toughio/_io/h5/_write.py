@@ -1,6 +1,7 @@
 import pathlib
 
 import h5py
+import numpy as np
 
 from ..output import ConnectionOutput, ElementOutput
 from ..output import read as read_output
@@ -17,6 +18,10 @@ def write(
     rock_history=None,
     labels_order=None,
     compression_opts=4,
+    compression="gzip",
+    shuffle=False,
+    layout="group",
+    append=False,
 ):
     """
     Write TOUGH outputs to a HDF5 file.
@@ -41,40 +46,57 @@ def write(
         List of labels.
     compression_opts : int, optional, default 4
         Compression level for gzip compression. May be an integer from 0 to 9.
+    compression : {'gzip', 'lzf'} or None, optional, default 'gzip'
+        Compression filter. If None, data are not compressed.
+    shuffle : bool, optional, default False
+        If `True`, enable shuffle filter (usually improves compression ratio).
+    layout : {'group', 'series'}, optional, default 'group'
+        Layout of element and connection outputs:
 
-    """
-    kwargs = {
-        "compression": "gzip",
-        "compression_opts": compression_opts,
-    }
-
-    with h5py.File(filename, "w") as f:
-        if elements is not None:
-            group = f.create_group("elements")
-            _write_output(group, elements, labels_order, connection=False, **kwargs)
-
-        if connections is not None:
-            group = f.create_group("connections")
-            _write_output(group, connections, labels_order, connection=True, **kwargs)
-
-        if element_history is not None:
-            group = f.create_group("element_history")
-            _write_table(group, element_history, **kwargs)
+         - 'group': one group per time step with one dataset per variable,
+         - 'series': one chunked dataset of shape (n_times, n_data) per variable (all
+           time steps must have the same labels).
 
-        if connection_history is not None:
-            group = f.create_group("connection_history")
-            _write_table(group, connection_history, **kwargs)
+    append : bool, optional, default False
+        If `True`, append outputs to an existing file (time steps are appended to
+        existing datasets if ``layout = "series"``) and overwrite existing tables.
 
-        if generator_history is not None:
-            group = f.create_group("generator_history")
-            _write_table(group, generator_history, **kwargs)
-
-        if rock_history is not None:
-            group = f.create_group("rock_history")
-            _write_table(group, rock_history, **kwargs)
+    """
+    if compression not in {"gzip", "lzf", None}:
+        raise ValueError()
 
+    if layout not in {"group", "series"}:
+        raise ValueError()
 
-def _write_output(f, outputs, labels_order, connection, **kwargs):
+    kwargs = {"compression": compression, "shuffle": shuffle}
+    if compression == "gzip":
+        kwargs["compression_opts"] = compression_opts
+
+    with h5py.File(filename, "a" if append else "w") as f:
+        for name, outputs, connection in zip(
+            ["elements", "connections"], [elements, connections], [False, True]
+        ):
+            if outputs is not None:
+                group = f.require_group(name)
+                _write_output(
+                    group, outputs, labels_order, connection, layout, **kwargs
+                )
+
+        for name, tables in zip(
+            [
+                "element_history",
+                "connection_history",
+                "generator_history",
+                "rock_history",
+            ],
+            [element_history, connection_history, generator_history, rock_history],
+        ):
+            if tables is not None:
+                group = f.require_group(name)
+                _write_table(group, tables, **kwargs)
+
+
+def _write_output(f, outputs, labels_order, connection, layout="group", **kwargs):
     """Write TOUGH output to group."""
     if isinstance(outputs, (str, pathlib.Path)):
         outputs = read_output(outputs, labels_order=labels_order, connection=connection)
@@ -90,6 +112,11 @@ def _write_output(f, outputs, labels_order, connection, **kwargs):
     else:
         raise ValueError()
 
+    if layout == "series":
+        _write_output_series(f, outputs, **kwargs)
+
+        return
+
     for output in outputs:
         group = f.create_group(f"time={output.time}")
         group.create_dataset("labels", data=list(output.labels), **kwargs)
@@ -98,12 +125,69 @@ def _write_output(f, outputs, labels_order, connection, **kwargs):
             group.create_dataset(k, data=v, **kwargs)
 
 
+def _write_output_series(f, outputs, **kwargs):
+    """Write TOUGH output to group with one time series dataset per variable."""
+    labels = outputs[0].labels
+    for output in outputs[1:]:
+        if not np.array_equal(output.labels, labels):
+            raise ValueError("All time steps must have the same labels.")
+
+    n_data = outputs[0].n_data
+    variables = list(outputs[0].data)
+
+    if "time" not in f:
+        chunks = _get_chunks(n_data)
+        f.create_dataset("time", shape=(0,), maxshape=(None,), dtype=float)
+        f.create_dataset("labels", data=labels, **kwargs)
+
+        for k in variables:
+            f.create_dataset(
+                k,
+                shape=(0, n_data),
+                maxshape=(None, n_data),
+                chunks=chunks,
+                dtype=float,
+                **kwargs,
+            )
+
+    elif not np.array_equal(f["labels"].asstr()[()], labels):
+        raise ValueError("Labels differ from labels of existing datasets.")
+
+    elif sorted(variables) != sorted(k for k in f if k not in {"time", "labels"}):
+        raise ValueError("Variables differ from variables of existing datasets.")
+
+    # Append time steps
+    n_times = len(f["time"])
+    n_new = len(outputs)
+
+    f["time"].resize((n_times + n_new,))
+    f["time"][n_times:] = [output.time for output in outputs]
+
+    for k in variables:
+        f[k].resize((n_times + n_new, n_data))
+        f[k][n_times:] = np.array([output.data[k] for output in outputs])
+
+
+def _get_chunks(n_data):
+    """
+    Return chunk shape of time series datasets.
+
+    Chunks of at most 16 time steps by 8192 elements or connections (1 MB) such that
+    reading either a snapshot or a history only decompresses a few chunks.
+
+    """
+    return 16, max(min(n_data, 8192), 1)
+
+
 def _write_table(f, tables, **kwargs):
     """Write TOUGH table to group."""
     if not isinstance(tables, dict):
         raise ValueError()
 
     for name, table in tables.items():
+        if name in f:
+            del f[name]
+
         group = f.create_group(name)
 
         if isinstance(table, (str, pathlib.Path)):
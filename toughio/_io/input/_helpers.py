@@ -1,4 +1,7 @@
+import os
+
 from ..._common import filetype_from_filename, register_format
+from .._common import get_cache_path
 
 __all__ = [
     "register",
@@ -48,7 +51,7 @@ def register(file_format, extensions, reader, writer=None):
     )
 
 
-def read(filename, file_format=None, **kwargs):
+def read(filename, file_format=None, cache_dir=None, **kwargs):
     """
     Read TOUGH input file.
 
@@ -58,6 +61,10 @@ def read(filename, file_format=None, **kwargs):
         Input file name or buffer.
     file_format : str ('tough', 'toughreact-flow', 'toughreact-solute', 'toughreact-chemical', 'json') or None, optional, default None
         Input file format.
+    cache_dir : str, pathlike or None, optional, default None
+        Directory where parsed input parameters are cached. Later calls with the same
+        file (path, size and modification time) and options load the cache instead of
+        parsing the file. Ignored for buffers.
 
     Other Parameters
     ----------------
@@ -86,9 +93,32 @@ def read(filename, file_format=None, **kwargs):
         raise ValueError()
 
     file_format = _get_file_format(filename, file_format, default="tough")
+
+    if cache_dir is not None and file_format != "json":
+        path = get_cache_path(filename, cache_dir, file_format, kwargs)
+
+        if path is not None:
+            return _read_cache(f"{path}.json", filename, file_format, **kwargs)
+
     return _reader_map[file_format](filename, **kwargs)
 
 
+def _read_cache(path, filename, file_format, **kwargs):
+    """Read input file from cache or parse it and save it to cache."""
+    # Parameters are cached using JSON format
+    if os.path.isfile(path):
+        return _reader_map["json"](path)
+
+    parameters = _reader_map[file_format](filename, **kwargs)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmpfile = f"{path}.{os.getpid()}"
+    _writer_map["json"](tmpfile, parameters)
+    os.replace(tmpfile, path)
+
+    return parameters
+
+
 def write(filename, parameters, file_format=None, **kwargs):
     """
     Write TOUGH input file.
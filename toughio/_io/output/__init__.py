@@ -1,11 +1,16 @@
 from . import csv, petrasim, save, tecplot, tough
-from ._common import ConnectionOutput, ElementOutput
-from ._helpers import read, register, write
+from ._common import ConnectionOutput, ElementOutput, OutputSeries, TimeSeriesOutput
+from ._follower import OutputFollower
+from ._helpers import iterate, read, register, write
 
 __all__ = [
     "ElementOutput",
     "ConnectionOutput",
+    "TimeSeriesOutput",
+    "OutputSeries",
+    "OutputFollower",
     "register",
     "read",
+    "iterate",
     "write",
 ]
@@ -1,10 +1,18 @@
 import logging
+import mmap
+import os
+import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
 
 import numpy as np
 
 __all__ = [
     "Output",
+    "TimeSeriesOutput",
+    "OutputSeries",
 ]
 
 
@@ -18,7 +26,8 @@ class Output(ABC):
         """
         self._time = time
         self._data = data
-        self._labels = list(labels) if labels is not None else labels
+        self._labels = to_labels(labels)
+        self._label_index = {}
 
     @abstractmethod
     def __getitem__(self, islice):
@@ -65,11 +74,42 @@ class Output(ABC):
             if len(value) != self.n_data:
                 raise ValueError()
 
-            self._labels = list(value)
+            self._labels = to_labels(value)
 
         else:
             self._labels = None
 
+        # Label index may be shared with other time steps
+        self._label_index = {}
+
+    def _get_label_index(self, label):
+        """
+        Return index of label.
+
+        The mapping from label to index is built on first call, and rebuilt if labels
+        have been modified in place.
+
+        """
+        index = self._label_index.get(label)
+
+        if index is None or index >= len(self.labels) or self._key(index) != label:
+            self._label_index.clear()
+            self._label_index.update(get_label_index(self.labels))
+
+            try:
+                index = self._label_index[label]
+
+            except KeyError:
+                raise ValueError(f"'{label}' is not in list")
+
+        return index
+
+    def _key(self, i):
+        """Return key of i-th label in label index."""
+        label = self.labels[i]
+
+        return label if isinstance(label, str) else "".join(label)
+
 
 class ElementOutput(Output):
     def __init__(self, time, data, labels=None):
@@ -144,7 +184,7 @@ class ElementOutput(Output):
         """
         super().index(label, *args, **kwargs)
 
-        return self.labels.index(label)
+        return self._get_label_index(label)
 
 
 class ConnectionOutput(Output):
@@ -226,21 +266,508 @@ class ConnectionOutput(Output):
 
         """
         super().index(label, *args, **kwargs)
-        labels = ["".join(label) for label in self.labels]
 
         if label2 is not None:
             label = f"{label}{label2}"
 
-        return labels.index(label)
+        return self._get_label_index(label)
+
+
+class TimeSeriesOutput(list):
+    def __init__(self, outputs=None):
+        """
+        Time series of output data.
+
+        Behaves like a list of output data.
+
+        Parameters
+        ----------
+        outputs : sequence of :class:`toughio.ElementOutput`, sequence of :class:`toughio.ConnectionOutput` or None, optional, default None
+            Output data for each time step.
+
+        """
+        super().__init__(outputs if outputs is not None else [])
+
+    @property
+    def times(self):
+        """Return time steps (in seconds)."""
+        return np.array([output.time for output in self])
+
+    @property
+    def labels(self):
+        """Return labels shared by all time steps (None if labels differ)."""
+        if not self:
+            return None
+
+        labels = self[0].labels
+
+        return (
+            labels
+            if all(
+                output.labels is labels or output.labels == labels for output in self
+            )
+            else None
+        )
+
+
+class OutputSeries:
+    def __init__(self, times, data, variables, labels=None, connection=False):
+        """
+        Dense time series of output data.
+
+        Data of all time steps are stored in a single array of shape (n_times,
+        n_data, n_variables).
+
+        Parameters
+        ----------
+        times : array_like
+            Time steps (in seconds).
+        data : array_like
+            Data array of shape (n_times, n_data, n_variables).
+        variables : sequence of str
+            Names of variables.
+        labels : sequence of str or None, default, None
+            Labels of elements or connections.
+        connection : bool, optional, default False
+            If `True`, data are related to connections.
+
+        """
+        self._times = np.asarray(times, dtype=float)
+        self._data = np.asarray(data, dtype=float)
+        self._variables = list(variables)
+        self._labels = to_labels(labels)
+        self._connection = connection
+
+        if (
+            self._data.ndim != 3
+            or len(self._data) != len(self._times)
+            or self._data.shape[2] != len(self._variables)
+        ):
+            raise ValueError()
+
+        if self._labels is not None and len(self._labels) != self.n_data:
+            raise ValueError()
+
+        self._variable_index = {k: i for i, k in enumerate(self._variables)}
+        self._label_index = None
+
+    @classmethod
+    def from_output(cls, outputs, n_times=None):
+        """
+        Create dense time series from output data.
+
+        Parameters
+        ----------
+        outputs : :class:`toughio.ElementOutput`, :class:`toughio.ConnectionOutput`, iterable of :class:`toughio.ElementOutput` or iterable of :class:`toughio.ConnectionOutput`
+            Output data for each time step. All time steps must have the same
+            variables and labels. Time steps are copied one at a time such that
+            iterators (e.g., :func:`toughio.iterate_output`) are consumed without
+            keeping all the time steps in memory.
+        n_times : int or None, optional, default None
+            Expected number of time steps used to preallocate the data array if
+            `outputs` has no length.
+
+        Returns
+        -------
+        :class:`toughio.OutputSeries`
+            Dense time series.
+
+        """
+        outputs = [outputs] if isinstance(outputs, Output) else outputs
+        n_times = len(outputs) if hasattr(outputs, "__len__") else n_times
+
+        times, data = [], None
+        for i, output in enumerate(outputs):
+            if data is None:
+                first, labels = output, output.labels
+                variables = list(output.data)
+                shape = (max(n_times or 1, 1), output.n_data, len(variables))
+                data = np.empty(shape)
+
+            elif not (
+                output.labels is labels
+                or (labels is not None and output.labels == labels)
+            ):
+                raise ValueError("Time steps must have the same labels.")
+
+            # Capacity is doubled if the expected number of time steps is exceeded
+            if i == len(data):
+                data = np.concatenate((data, np.empty_like(data)))
+
+            for j, k in enumerate(variables):
+                data[i, :, j] = output.data[k]
+
+            times.append(output.time)
+
+        if data is None:
+            raise ValueError()
+
+        data = data if len(times) == len(data) else data[: len(times)].copy()
+
+        return cls(
+            times,
+            data,
+            variables,
+            labels,
+            connection=isinstance(first, ConnectionOutput),
+        )
+
+    def __len__(self):
+        """Return number of time steps."""
+        return len(self._times)
+
+    def __getitem__(self, key):
+        """
+        Slice dense time series.
+
+        Parameters
+        ----------
+        key : str or tuple
+            Name of variable, or tuple (variable, labels) where labels are labels or
+            indices of elements or connections (connection labels are concatenated
+            element labels).
+
+        Returns
+        -------
+        array_like
+            Time series of variable for selected elements or connections.
+
+        """
+        if isinstance(key, tuple):
+            variable, islice = key
+
+            if isinstance(islice, str):
+                islice = self.index(islice)
+
+            elif np.ndim(islice) == 1:
+                islice = [self.index(i) if isinstance(i, str) else i for i in islice]
+
+        else:
+            variable, islice = key, slice(None)
+
+        return self._data[:, islice, self._get_variable_index(variable)]
+
+    def index(self, label):
+        """
+        Get index of element or connection.
+
+        Parameters
+        ----------
+        label : str
+            Label of element or connection (concatenated element labels).
+
+        Returns
+        -------
+        int
+            Index of element or connection.
+
+        """
+        if self._labels is None:
+            raise AttributeError()
+
+        if self._label_index is None:
+            self._label_index = get_label_index(self._labels)
+
+        try:
+            return self._label_index[label]
+
+        except KeyError:
+            raise ValueError(f"'{label}' is not in list")
+
+    def interpolate(self, time, variables=None):
+        """
+        Linearly interpolate data at given time.
+
+        Data are extrapolated as constant outside of the time range. Time steps do not
+        need to be sorted.
+
+        Parameters
+        ----------
+        time : scalar or array_like
+            Time(s) at which data are interpolated (in seconds).
+        variables : sequence of str or None, optional, default None
+            Variables to interpolate. If None, all variables are interpolated.
+
+        Returns
+        -------
+        :class:`toughio.ElementOutput`, :class:`toughio.ConnectionOutput` or :class:`toughio.OutputSeries`
+            Interpolated output data (dense time series if `time` is an array).
+
+        """
+        variables = variables if variables is not None else self._variables
+        ivars = [self._get_variable_index(variable) for variable in variables]
+
+        # Time steps are sorted for the search of time intervals
+        order = np.argsort(self._times, kind="stable")
+        sorted_times = self._times[order]
+        times = np.clip(np.ravel(time).astype(float), sorted_times[0], sorted_times[-1])
+
+        # Find time interval and weight of each time
+        i1 = np.clip(np.searchsorted(sorted_times, times), 1, len(sorted_times) - 1)
+        i0 = np.maximum(i1 - 1, 0)
+        dt = sorted_times[i1] - sorted_times[i0]
+        w = np.divide(
+            times - sorted_times[i0], dt, out=np.zeros_like(times), where=dt > 0.0
+        )[:, None, None]
+        i0, i1 = order[i0], order[i1]
+
+        data0 = self._data[i0][:, :, ivars]
+        data1 = self._data[i1][:, :, ivars]
+        data = data0 + w * (data1 - data0)
+
+        if np.ndim(time) == 0:
+            return self._to_output(times[0], data[0], variables)
+
+        return OutputSeries(times, data, variables, self._labels, self._connection)
+
+    def min(self, axis=0):
+        """
+        Return minimum of variables.
+
+        Parameters
+        ----------
+        axis : int, optional, default 0
+            Axis along which the minimum is computed (0: time, 1: elements or connections).
+
+        Returns
+        -------
+        dict
+            Minimum of each variable.
+
+        """
+        return self._reduce(np.min, axis)
+
+    def max(self, axis=0):
+        """
+        Return maximum of variables.
+
+        Parameters
+        ----------
+        axis : int, optional, default 0
+            Axis along which the maximum is computed (0: time, 1: elements or connections).
+
+        Returns
+        -------
+        dict
+            Maximum of each variable.
+
+        """
+        return self._reduce(np.max, axis)
+
+    def mean(self, axis=0):
+        """
+        Return mean of variables.
+
+        Parameters
+        ----------
+        axis : int, optional, default 0
+            Axis along which the mean is computed (0: time, 1: elements or connections).
+
+        Returns
+        -------
+        dict
+            Mean of each variable.
+
+        """
+        return self._reduce(np.mean, axis)
+
+    def sum(self, axis=0):
+        """
+        Return sum of variables.
+
+        Parameters
+        ----------
+        axis : int, optional, default 0
+            Axis along which the sum is computed (0: time, 1: elements or connections).
+
+        Returns
+        -------
+        dict
+            Sum of each variable.
+
+        """
+        return self._reduce(np.sum, axis)
+
+    def to_output(self):
+        """
+        Convert dense time series to output data.
+
+        Returns
+        -------
+        :class:`toughio.TimeSeriesOutput`
+            Output data for each time step (data arrays are views of dense array).
+
+        """
+        return TimeSeriesOutput(
+            self._to_output(time, data, self._variables)
+            for time, data in zip(self._times, self._data)
+        )
+
+    def _get_variable_index(self, variable):
+        """Return index of variable."""
+        try:
+            return self._variable_index[variable]
+
+        except KeyError:
+            raise ValueError(f"Unknown variable: {variable}.")
+
+    def _reduce(self, func, axis):
+        """Reduce data along axis."""
+        if axis not in {0, 1}:
+            raise ValueError()
+
+        data = func(self._data, axis=axis)
+
+        return {k: data[:, i] for i, k in enumerate(self._variables)}
+
+    def _to_output(self, time, data, variables):
+        """Create output data of a time step."""
+        output = ConnectionOutput if self._connection else ElementOutput
+
+        return output(
+            time, {k: data[:, i] for i, k in enumerate(variables)}, self._labels
+        )
+
+    @property
+    def times(self):
+        """Return time steps (in seconds)."""
+        return self._times
+
+    @property
+    def data(self):
+        """Return data array of shape (n_times, n_data, n_variables)."""
+        return self._data
+
+    @property
+    def variables(self):
+        """Return names of variables."""
+        return self._variables
+
+    @property
+    def labels(self):
+        """Return labels."""
+        return self._labels
+
+    @property
+    def n_times(self):
+        """Return number of time steps."""
+        return self._data.shape[0]
+
+    @property
+    def n_data(self):
+        """Return number of data points."""
+        return self._data.shape[1]
+
+
+class LazyOutput(Sequence):
+    def __init__(self, reader, times, maxsize=4, close=None):
+        """
+        Lazy output data.
+
+        Time steps are read on first access and only the most recently accessed time
+        steps are kept in memory. Can be used as a context manager.
+
+        Parameters
+        ----------
+        reader : callable
+            Function that takes the index of a time step and returns its output data.
+        times : sequence of scalar
+            Time steps (in seconds).
+        maxsize : int, optional, default 4
+            Maximum number of time steps kept in memory.
+        close : callable or None, optional, default None
+            Function called to release resources used by `reader` (e.g., close file).
+
+        """
+        self._reader = reader
+        self._times = np.asarray(times, dtype=float)
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._close = close
+        self._closed = False
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close on exit."""
+        self.close()
+
+    def close(self):
+        """Release resources (time steps can no longer be read)."""
+        if not self._closed:
+            self._closed = True
+            self._cache.clear()
+
+            if self._close is not None:
+                self._close()
+
+    def __len__(self):
+        """Return number of time steps."""
+        return len(self._times)
+
+    def __getitem__(self, islice):
+        """
+        Read output data of time step(s).
+
+        Parameters
+        ----------
+        islice : int or slice
+            Index or slice of time steps.
+
+        Returns
+        -------
+        :class:`toughio.ElementOutput`, :class:`toughio.ConnectionOutput`, sequence of :class:`toughio.ElementOutput` or sequence of :class:`toughio.ConnectionOutput`
+            Output data.
+
+        """
+        if isinstance(islice, slice):
+            return [self[i] for i in range(*islice.indices(len(self)))]
+
+        i = int(islice)
+        i = i + len(self) if i < 0 else i
+        if not 0 <= i < len(self):
+            raise IndexError()
+
+        if self._closed:
+            raise ValueError("I/O operation on closed output.")
+
+        if i in self._cache:
+            self._cache.move_to_end(i)
+
+        else:
+            self._cache[i] = self._reader(i)
+
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        return self._cache[i]
+
+    @property
+    def times(self):
+        """Return time steps (in seconds)."""
+        return self._times
 
 
 def to_output(file_type, labels_order, headers, times, labels, data):
     """Helper function to create output data objects."""
     outputs = []
+    labels_prev, labels_list, label_index = None, None, {}
+
     for time, labels_, data_ in zip(times, labels, data):
+        # Time steps with the same labels share the same label index
+        if labels_ is not labels_prev:
+            labels_prev = labels_
+            labels_ = (
+                to_labels(labels_) if labels_ is not None and len(labels_) else None
+            )
+
+            if labels_ != labels_list:
+                labels_list, label_index = labels_, {}
+
         kwargs = {
             "time": time,
-            "labels": labels_ if labels_ is not None and len(labels_) else None,
             "data": {k: v for k, v in zip(headers, np.transpose(data_))},
         }
 
@@ -249,41 +776,437 @@ def to_output(file_type, labels_order, headers, times, labels, data):
             if file_type == "element"
             else ConnectionOutput(**kwargs)
         )
+
+        # Each time step owns its labels such that in-place edits do not relabel others
+        output._labels = _copy_labels(labels_list)
+        output._label_index = label_index
         outputs.append(output)
 
     # Some older versions of TOUGH3 have duplicate connection outputs when running in parallel
     # Fix the outputs here by summing the duplicate connections
-    if file_type == "connection" and len(labels[0]):
-        # Check whether there are duplicate connections
-        connections = {}
-        found_duplicate = False
-
-        for i, (c1, c2) in enumerate(outputs[0].labels):
-            if (c1, c2) in connections:
-                connections[(c1, c2)].append(i)
-                found_duplicate = True
-
-            else:
-                connections[(c1, c2)] = [i]
-
-        if found_duplicate:
-            logging.warning(
-                "Found duplicate connections. Fixing outputs by summing duplicate connections."
-            )
-
-            outputs = [
-                ConnectionOutput(
+    if file_type == "connection" and labels[0] is not None and len(labels[0]):
+        # Mapping to unique connections is computed once per distinct labels
+        mappings, label_indices = {}, {}
+
+        for i, output in enumerate(outputs):
+            if output.labels is None:
+                continue
+
+            key = id(output.labels)
+            if key not in mappings:
+                mappings[key] = _get_duplicate_mapping(output.labels)
+
+                if mappings[key] is not None:
+                    logging.warning(
+                        "Found duplicate connections. Fixing outputs by summing duplicate connections."
+                    )
+
+            if mappings[key] is not None:
+                labels_list, inverse = mappings[key]
+                outputs[i] = ConnectionOutput(
                     time=output.time,
                     data={
-                        k: np.array([v[idx].sum() for idx in connections.values()])
+                        k: np.bincount(inverse, weights=v, minlength=len(labels_list))
                         for k, v in output.data.items()
                     },
-                    labels=list(connections),
                 )
-                for output in outputs
-            ]
+                outputs[i]._labels = _copy_labels(labels_list)
+                outputs[i]._label_index = label_indices.setdefault(key, {})
+
+    outputs = TimeSeriesOutput(outputs)
 
     if file_type == "element" and labels_order is not None:
-        outputs = [output[labels_order] for output in outputs]
+        outputs = TimeSeriesOutput(output[labels_order] for output in outputs)
 
     return outputs[0] if len(outputs) == 1 else outputs
+
+
+def _get_duplicate_mapping(labels):
+    """
+    Map connection labels to unique connections.
+
+    Return None if there is no duplicate connection, otherwise the unique labels (in
+    order of first occurrence) and the index of the unique connection of each label.
+
+    """
+    labels = np.asarray(labels)
+    _, index, inverse = np.unique(
+        labels, axis=0, return_index=True, return_inverse=True
+    )
+
+    if len(index) == len(labels):
+        return None
+
+    # Reorder unique connections by first occurrence
+    order = np.argsort(index)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    return to_labels(labels[index[order]]), rank[inverse.ravel()]
+
+
+def get_label_index(labels):
+    """
+    Helper function to map labels to indices.
+
+    Connection labels are mapped as concatenated element labels.
+
+    """
+    keys = [label if isinstance(label, str) else "".join(label) for label in labels]
+
+    # Reverse order such that first occurrence of duplicate label is kept
+    return dict(zip(keys[::-1], range(len(keys) - 1, -1, -1)))
+
+
+def _copy_labels(labels):
+    """Copy labels (including connection labels)."""
+    if labels is None:
+        return None
+
+    return [label if isinstance(label, str) else list(label) for label in labels]
+
+
+def to_labels(labels):
+    """Helper function to convert labels to a list (connection labels as lists)."""
+    if labels is None:
+        return None
+
+    return (
+        np.asarray(labels, dtype=str).tolist()
+        if isinstance(labels, np.ndarray)
+        else list(labels)
+    )
+
+
+def get_time_steps(time_steps, count):
+    """
+    Helper function to convert time steps to a set of non-negative indices.
+
+    Function `count` is only called if negative time steps need to be converted.
+
+    """
+    if time_steps is None:
+        return None
+
+    if isinstance(time_steps, int):
+        time_steps = [time_steps]
+
+    if any(i < 0 for i in time_steps):
+        n_steps = count()
+        time_steps = [i if i >= 0 else n_steps + i for i in time_steps]
+
+    return set(time_steps)
+
+
+def get_columns(headers, variables):
+    """
+    Helper function to get the indices of the data columns to read.
+
+    Return projected headers and column indices (None if all columns are read).
+
+    """
+    if variables is None:
+        return headers, None
+
+    if isinstance(variables, str):
+        variables = [variables]
+
+    missing = [variable for variable in variables if variable not in headers]
+    if missing:
+        raise ValueError(f"Unknown variable(s): {', '.join(missing)}.")
+
+    columns = [headers.index(variable) for variable in variables]
+
+    return [headers[i] for i in columns], columns
+
+
+def get_path(filename):
+    """
+    Helper function to get the path of a file.
+
+    Return the path of file objects opened from a file name, and None for other
+    buffers.
+
+    """
+    if isinstance(filename, (str, os.PathLike)):
+        return filename
+
+    path = getattr(filename, "name", None)
+
+    return (
+        path if isinstance(path, (str, os.PathLike)) and os.path.isfile(path) else None
+    )
+
+
+def get_time_step_index(filename, indexer):
+    """
+    Helper function to get the time step index of an output file.
+
+    The index is built by `indexer` on first call and cached in memory for later calls
+    given the path, size and modification time of the file. Return None for buffers.
+
+    """
+    filename = get_path(filename)
+
+    if filename is None:
+        return None
+
+    stat = os.stat(filename)
+
+    return _index_time_steps(
+        indexer, os.path.abspath(filename), stat.st_size, stat.st_mtime_ns
+    )
+
+
+def count_time_steps(filename, counter, indexer=None):
+    """
+    Helper function to count the number of time steps of an output file.
+
+    The cached time step index is used if available. Otherwise, time steps are counted
+    by `counter` and the position of buffers is restored.
+
+    """
+    index = get_time_step_index(filename, indexer) if indexer is not None else None
+
+    if index is not None:
+        return len(index)
+
+    if not hasattr(filename, "seek"):
+        return counter(filename)
+
+    position = filename.tell()
+    count = counter(filename)
+    filename.seek(position)
+
+    return count
+
+
+@lru_cache(maxsize=32)
+def _index_time_steps(indexer, filename, size, mtime):
+    """Index time steps (cached)."""
+    return indexer(filename)
+
+
+def index_lines(filename, key, ignore_case=False):
+    """
+    Helper function to index byte ranges of blocks starting with key.
+
+    A block starts at a line starting with key (ignoring leading whitespaces and case
+    if `ignore_case` is `True`) and ends at the start of the next block (or end of
+    file).
+
+    """
+    with open(filename, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except ValueError:  # Empty file
+            return []
+
+        with mm:
+            starts = []
+            start = find_line(mm, key, ignore_case=ignore_case)
+
+            while start is not None:
+                starts.append(start)
+                start = find_line(
+                    mm, key, next_line(mm, start), ignore_case=ignore_case
+                )
+
+            return list(zip(starts, starts[1:] + [len(mm)]))
+
+
+def next_line(mm, start):
+    """Return byte offset of line following the line at start."""
+    i = mm.find(b"\n", start)
+
+    return i + 1 if i >= 0 else len(mm)
+
+
+def find_line(mm, key, start=0, end=None, ignore_case=False):
+    """Find byte offset of first line starting with key (ignoring whitespaces)."""
+    end = end if end is not None else len(mm)
+
+    if ignore_case:
+        match = _line_pattern(key).search(mm, start, end)
+
+        return match.start() if match else None
+
+    i = mm.find(key, start, end)
+    while i >= 0:
+        j = mm.rfind(b"\n", 0, i) + 1
+        if not mm[j:i].strip():
+            return j
+
+        i = mm.find(key, i + 1, end)
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _line_pattern(key):
+    """Return case-insensitive pattern of lines starting with key."""
+    return re.compile(rb"^[^\S\n]*" + re.escape(key), re.IGNORECASE | re.MULTILINE)
+
+
+def read_bytes(filename, start, end):
+    """Helper function to read and decode a byte range of a file."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+
+        return f.read(end - start).decode()
+
+
+def read_lines(filename, offsets):
+    """Helper function to read and decode the lines starting at byte offsets."""
+    lines = []
+
+    with open(filename, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            lines.append(f.readline().decode())
+
+    return lines
+
+
+def select_time_steps(times, values=None, value_range=None):
+    """
+    Helper function to select time steps by time.
+
+    Time steps closest to `values` or within `value_range` are found by binary search.
+
+    """
+    times = np.asarray(times, dtype=float)
+    order = np.argsort(times, kind="stable")
+    order = order[~np.isnan(times[order])]
+    times = times[order]
+
+    if not times.size:
+        raise ValueError("No time step with known time found.")
+
+    if values is not None:
+        values = np.ravel(values).astype(float)
+        idx = np.clip(np.searchsorted(times, values), 1, max(times.size - 1, 1))
+
+        if times.size > 1:
+            idx -= values - times[idx - 1] <= times[idx] - values
+
+        else:
+            idx = np.zeros_like(idx)
+
+    else:
+        tmin, tmax = value_range
+        tmin = tmin if tmin is not None else -np.inf
+        tmax = tmax if tmax is not None else np.inf
+        idx = np.arange(
+            np.searchsorted(times, tmin, side="left"),
+            np.searchsorted(times, tmax, side="right"),
+        )
+
+    if not idx.size:
+        raise ValueError("No time step found in time range.")
+
+    return sorted(set(order[idx].tolist()))
+
+
+def map_parallel(func, workers, *iterables):
+    """Helper function to map a function in a pool of processes."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, *iterables))
+
+
+def save_cache(path, outputs):
+    """
+    Helper function to save output data to cache.
+
+    Labels and data of each time step are saved as raw NumPy arrays along with a small
+    JSON header. Labels are saved once per distinct set of labels of consecutive time
+    steps, and the index of the labels of each time step is stored in the header.
+
+    """
+    import json
+    import shutil
+    import tempfile
+
+    if not outputs:
+        return
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmpdir = tempfile.mkdtemp(dir=os.path.dirname(path))
+
+    try:
+        header = {
+            "file_type": (
+                "element" if isinstance(outputs[0], ElementOutput) else "connection"
+            ),
+            "headers": list(outputs[0].data),
+            "times": [],
+            "labels": [],
+        }
+        labels_prev, ilab, n_labels = None, -1, 0
+
+        for i, output in enumerate(outputs):
+            labels = output.labels
+
+            if labels is None:
+                ilab = -1
+
+            elif ilab < 0 or not (labels is labels_prev or labels == labels_prev):
+                ilab, n_labels = n_labels, n_labels + 1
+                np.save(os.path.join(tmpdir, f"labels_{ilab}.npy"), labels)
+
+            labels_prev = labels
+            header["times"].append(
+                float(output.time) if output.time is not None else None
+            )
+            header["labels"].append(ilab)
+            np.save(
+                os.path.join(tmpdir, f"data_{i}.npy"),
+                np.array([output.data[k] for k in header["headers"]], dtype=float),
+            )
+
+        with open(os.path.join(tmpdir, "header.json"), "w") as f:
+            json.dump(header, f)
+
+        # Another process may have written the same entry in the meantime
+        os.rename(tmpdir, path)
+
+    except OSError:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def load_cache(path):
+    """
+    Helper function to load output data from cache.
+
+    Data are returned as read-only memory-mapped arrays. Time steps with the same
+    labels share the same label index. Return None if the cache entry does not exist.
+
+    """
+    import json
+
+    try:
+        with open(os.path.join(path, "header.json"), "r") as f:
+            header = json.load(f)
+
+    except FileNotFoundError:
+        return None
+
+    output = ElementOutput if header["file_type"] == "element" else ConnectionOutput
+    labels, label_indices = {}, {}
+    outputs = []
+
+    for i, (time, ilab) in enumerate(zip(header["times"], header["labels"])):
+        if ilab >= 0 and ilab not in labels:
+            labels[ilab] = to_labels(np.load(os.path.join(path, f"labels_{ilab}.npy")))
+
+        data = np.load(os.path.join(path, f"data_{i}.npy"), mmap_mode="r")
+        outputs.append(output(time, {k: v for k, v in zip(header["headers"], data)}))
+
+        if ilab >= 0:
+            outputs[-1]._labels = _copy_labels(labels[ilab])
+            outputs[-1]._label_index = label_indices.setdefault(ilab, {})
+
+    return TimeSeriesOutput(outputs)
@@ -0,0 +1,158 @@
+import mmap
+import os
+
+from ._common import TimeSeriesOutput
+from ._helpers import _get_file_type_format
+from .csv._csv import follow as follow_csv
+from .tecplot._tecplot import follow as follow_tecplot
+from .tough._tough import follow as follow_tough
+
+__all__ = [
+    "OutputFollower",
+]
+
+
+_follower_map = {
+    "csv": follow_csv,
+    "tecplot": follow_tecplot,
+    "tough": follow_tough,
+}
+
+
+class OutputFollower:
+    def __init__(
+        self,
+        filename,
+        file_format=None,
+        labels_order=None,
+        connection=False,
+        variables=None,
+        **kwargs,
+    ):
+        """
+        Follow a TOUGH output file written by a running simulation.
+
+        File position and parser state are kept between calls to :meth:`poll` such
+        that already read time steps are not parsed again.
+
+        Parameters
+        ----------
+        filename : str or pathlike
+            Input file name.
+        file_format : {'csv', 'tecplot', 'tough'} or None, optional, default None
+            Input file format. If None, it is guessed once the first line of the file
+            has been written.
+        labels_order : sequence of array_like or None, optional, default None
+            List of labels. If None, output will be assumed ordered.
+        connection : bool, optional, default False
+            Only for standard TOUGH output file. If `True`, return data related to connections.
+        variables : sequence of str or None, optional, default None
+            List of variables to read. If None, all variables will be read.
+
+        Other Parameters
+        ----------------
+        engine : {'python', 'fast'}, optional, default 'python'
+            Only if ``file_format = "tough"``. Parsing engine for data tables.
+
+        """
+        if not (file_format is None or file_format in _follower_map):
+            raise ValueError()
+
+        self._filename = filename
+        self._file_format = file_format
+        self._file_type = None
+        self._labels_order = labels_order
+        self._connection = connection
+        self._variables = variables
+        self._kwargs = kwargs
+        self._offset = 0
+        self._state = {}
+        self._n_time_steps = 0
+
+    def poll(self):
+        """
+        Read time steps completed since last call.
+
+        Returns
+        -------
+        :class:`toughio.TimeSeriesOutput`
+            Output data of new time steps (empty if no new time step).
+
+        """
+        if not os.path.isfile(self._filename) or not os.path.getsize(self._filename):
+            return TimeSeriesOutput()
+
+        if self._file_type is None:
+            # Format is only guessed once the lines read by the sniffer are complete
+            if self._file_format is None and not _has_first_line(self._filename):
+                return TimeSeriesOutput()
+
+            self._file_type, self._file_format = _get_file_type_format(
+                self._filename, self._file_format, self._connection
+            )
+
+            if self._file_format not in _follower_map:
+                raise ValueError(
+                    f"Following '{self._file_format}' files is not supported."
+                )
+
+        with open(self._filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                outputs, self._offset = _follower_map[self._file_format](
+                    mm,
+                    self._offset,
+                    self._state,
+                    self._file_type,
+                    self._labels_order,
+                    self._variables,
+                    **self._kwargs,
+                )
+
+        self._n_time_steps += len(outputs)
+
+        return TimeSeriesOutput(outputs)
+
+    def flush(self):
+        """
+        Read remaining time steps once the simulation has finished.
+
+        The last time step of a CSV file is only known to be complete once the next
+        time step starts. This method assumes that the file is no longer written and
+        also returns the last time step.
+
+        Returns
+        -------
+        :class:`toughio.TimeSeriesOutput`
+            Output data of new time steps (empty if no new time step).
+
+        """
+        self._state["final"] = True
+
+        return self.poll()
+
+    @property
+    def filename(self):
+        """Return file name."""
+        return self._filename
+
+    @property
+    def offset(self):
+        """Return byte offset of first incomplete time step."""
+        return self._offset
+
+    @property
+    def n_time_steps(self):
+        """Return number of time steps read so far."""
+        return self._n_time_steps
+
+
+def _has_first_line(filename):
+    """Check that the first non-empty line of a file has been completely written."""
+    with open(filename, "rb") as f:
+        line = f.readline()
+
+        # Standard TOUGH output files may start with an empty line
+        if not line.strip():
+            line = f.readline()
+
+    return line.endswith(b"\n")
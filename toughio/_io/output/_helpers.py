@@ -1,11 +1,24 @@
+from contextlib import contextmanager
+
 import numpy as np
 
 from ..._common import filetype_from_filename, open_file, register_format
-from ._common import Output
+from .._common import get_cache_path
+from ._common import (
+    Output,
+    OutputSeries,
+    TimeSeriesOutput,
+    get_path,
+    get_time_step_index,
+    load_cache,
+    save_cache,
+    select_time_steps,
+)
 
 __all__ = [
     "register",
     "read",
+    "iterate",
     "write",
 ]
 
@@ -13,9 +26,13 @@ __all__ = [
 _extension_to_filetype = {}
 _reader_map = {}
 _writer_map = {}
+_iterator_map = {}
+_time_reader_map = {}
 
 
-def register(file_format, extensions, reader, writer=None):
+def register(
+    file_format, extensions, reader, writer=None, iterator=None, time_reader=None
+):
     """
     Register a new output format.
 
@@ -29,6 +46,10 @@ def register(file_format, extensions, reader, writer=None):
         Read function.
     writer : callable or None, optional, default None
         Write function.
+    iterator : callable or None, optional, default None
+        Function that yields output data one time step at a time.
+    time_reader : callable or None, optional, default None
+        Function that returns the time of each time step without reading data.
 
     """
     register_format(
@@ -41,6 +62,12 @@ def register(file_format, extensions, reader, writer=None):
         writer=writer,
     )
 
+    if iterator is not None:
+        _iterator_map[file_format] = iterator
+
+    if time_reader is not None:
+        _time_reader_map[file_format] = time_reader
+
 
 def read(
     filename,
@@ -48,6 +75,12 @@ def read(
     labels_order=None,
     time_steps=None,
     connection=False,
+    variables=None,
+    times=None,
+    time_range=None,
+    cache_dir=None,
+    series=False,
+    **kwargs,
 ):
     """
     Read TOUGH SAVE or output file for each time step.
@@ -64,10 +97,46 @@ def read(
         List of time steps to read. If None, all time steps will be read.
     connection : bool, optional, default False
         Only for standard TOUGH output file. If `True`, return data related to connections.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. Only the data columns of these variables are decoded.
+        If None, all variables will be read.
+    times : scalar, array_like or None, optional, default None
+        Only if ``file_format`` in {'csv', 'petrasim', 'tecplot', 'tough'}. Read time
+        steps closest to these times (in seconds). Cannot be used with `time_steps`.
+    time_range : array_like or None, optional, default None
+        Only if ``file_format`` in {'csv', 'petrasim', 'tecplot', 'tough'}. Read time
+        steps with time within (tmin, tmax) (in seconds, bounds included). A bound set
+        to None is ignored. Cannot be used with `time_steps` or `times`.
+    cache_dir : str, pathlike or None, optional, default None
+        Directory where parsed outputs are cached in a binary format. Later calls with
+        the same file (path, size and modification time) and options load the cache
+        instead of parsing the file, and data are returned as read-only memory-mapped
+        arrays. Ignored for buffers and if ``lazy = True``.
+    series : bool, optional, default False
+        If `True`, return a dense time series. Time steps are parsed one at a time and
+        copied into a preallocated array such that the intermediate output data of all
+        time steps are not kept in memory. Cannot be used with ``lazy``, ``workers`` or
+        ``cache_dir``.
+
+    Other Parameters
+    ----------------
+    engine : {'python', 'fast'}, optional, default 'python'
+        Only if ``file_format = "tough"``. Parsing engine for data tables. 'fast'
+        decodes all the records of a data table at once given the column layout of the
+        first record.
+    lazy : bool, optional, default False
+        Only if ``file_format = "tough"``. If `True`, return a sequence-like object
+        that reads time steps on first access from the memory-mapped file and only
+        keeps the most recently accessed time steps in memory. The memory-mapped file
+        is released when the returned object is closed (it can be used as a context
+        manager).
+    workers : int or None, optional, default None
+        Only if ``file_format`` in {"csv", "tecplot", "tough"}. Number of processes used
+        to parse time steps in parallel. If None, time steps are parsed sequentially.
 
     Returns
     -------
-    :class:`toughio.ElementOutput`, :class:`toughio.ConnectionOutput`, sequence of :class:`toughio.ElementOutput` or sequence of :class:`toughio.ConnectionOutput`
+    :class:`toughio.ElementOutput`, :class:`toughio.ConnectionOutput`, sequence of :class:`toughio.ElementOutput`, sequence of :class:`toughio.ConnectionOutput` or :class:`toughio.OutputSeries`
         Output data for each time step.
 
     """
@@ -76,27 +145,157 @@ def read(
     ):
         raise TypeError()
 
-    if file_format is None:
-        # Guess type and format from content
-        file_type, file_format = get_output_type(filename)
+    if series and (
+        kwargs.get("lazy", False)
+        or kwargs.get("workers") is not None
+        or cache_dir is not None
+    ):
+        raise ValueError(
+            "Option 'series' cannot be used with 'lazy', 'workers' or 'cache_dir'."
+        )
 
-        # Otherwise, guess file format from extension
-        file_format = (
-            file_format
-            if file_format
-            else filetype_from_filename(filename, _extension_to_filetype, "")
+    with _open_output(filename, file_format, connection) as (f, file_type, file_format):
+        time_steps = _get_time_steps(f, file_format, time_steps, times, time_range)
+
+        if series:
+            outputs = _iterate(
+                f, file_type, file_format, labels_order, time_steps, variables, **kwargs
+            )
+
+            return OutputSeries.from_output(
+                outputs, _count_time_steps(f, file_format, time_steps)
+            )
+
+        if cache_dir is not None and not kwargs.get("lazy", False):
+            path = get_cache_path(
+                filename, cache_dir, file_format, file_type, time_steps, variables
+            )
+
+            if path is not None:
+                return _read_cache(
+                    path,
+                    f,
+                    file_type,
+                    file_format,
+                    labels_order,
+                    time_steps,
+                    variables,
+                    **kwargs,
+                )
+
+        return _reader_map[file_format](
+            f, file_type, labels_order, time_steps, variables, **kwargs
         )
 
-    else:
-        if file_format not in _reader_map:
-            raise ValueError()
 
-        file_type = "element"  # By default
+def _read_cache(
+    path,
+    filename,
+    file_type,
+    file_format,
+    labels_order,
+    time_steps,
+    variables,
+    **kwargs,
+):
+    """Read output file from cache or parse it and save it to cache."""
+    outputs = load_cache(path)
+
+    if outputs is None:
+        # Labels are reordered after caching such that the cache does not depend on it
+        outputs = _reader_map[file_format](
+            filename, file_type, None, time_steps, variables, **kwargs
+        )
+        outputs = [outputs] if isinstance(outputs, Output) else outputs
+        save_cache(path, outputs)
+
+    if file_type == "element" and labels_order is not None:
+        outputs = [output[labels_order] for output in outputs]
+
+    outputs = TimeSeriesOutput(outputs)
+
+    return outputs[0] if len(outputs) == 1 else outputs
+
+
+def iterate(
+    filename,
+    file_format=None,
+    labels_order=None,
+    time_steps=None,
+    connection=False,
+    variables=None,
+    times=None,
+    time_range=None,
+    **kwargs,
+):
+    """
+    Iterate over time steps of TOUGH SAVE or output file.
+
+    Time steps are read one at a time such that only the current time step is kept in
+    memory.
+
+    Parameters
+    ----------
+    filename : str, pathlike or buffer
+        Input file name or buffer.
+    file_format : {'csv', 'petrasim', 'save', 'tecplot', 'tough'} or None, optional, default None
+        Input file format.
+    labels_order : sequence of array_like or None, optional, default None
+        List of labels. If None, output will be assumed ordered.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    connection : bool, optional, default False
+        Only for standard TOUGH output file. If `True`, return data related to connections.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    times : scalar, array_like or None, optional, default None
+        Only if ``file_format`` in {'csv', 'petrasim', 'tecplot', 'tough'}. Read time
+        steps closest to these times (in seconds). Cannot be used with `time_steps`.
+    time_range : array_like or None, optional, default None
+        Only if ``file_format`` in {'csv', 'petrasim', 'tecplot', 'tough'}. Read time
+        steps with time within (tmin, tmax) (in seconds, bounds included). A bound set
+        to None is ignored. Cannot be used with `time_steps` or `times`.
+
+    Other Parameters
+    ----------------
+    engine : {'python', 'fast'}, optional, default 'python'
+        Only if ``file_format = "tough"``. Parsing engine for data tables.
+
+    Yields
+    ------
+    :class:`toughio.ElementOutput` or :class:`toughio.ConnectionOutput`
+        Output data for each time step.
+
+    """
+    if not (
+        labels_order is None or isinstance(labels_order, (list, tuple, np.ndarray))
+    ):
+        raise TypeError()
+
+    with _open_output(filename, file_format, connection) as (f, file_type, file_format):
+        time_steps = _get_time_steps(f, file_format, time_steps, times, time_range)
+
+        yield from _iterate(
+            f, file_type, file_format, labels_order, time_steps, variables, **kwargs
+        )
 
-    if connection:
-        file_type = "connection" if connection else "element"
 
-    return _reader_map[file_format](filename, file_type, labels_order, time_steps)
+def _iterate(
+    filename, file_type, file_format, labels_order, time_steps, variables, **kwargs
+):
+    """Yield output data one time step at a time (all at once if no iterator)."""
+    if file_format in _iterator_map:
+        outputs = _iterator_map[file_format](
+            filename, file_type, labels_order, time_steps, variables, **kwargs
+        )
+
+    else:
+        outputs = _reader_map[file_format](
+            filename, file_type, labels_order, time_steps, variables, **kwargs
+        )
+        outputs = [outputs] if isinstance(outputs, Output) else outputs
+
+    yield from outputs
 
 
 def write(filename, output, file_format=None, **kwargs):
@@ -134,55 +333,150 @@ def write(filename, output, file_format=None, **kwargs):
     return _writer_map[fmt](filename, output, **kwargs)
 
 
+@contextmanager
+def _open_output(filename, file_format=None, connection=False):
+    """
+    Open output file and guess its type and format.
+
+    The file is only opened once, and the same file object is passed to the reader.
+
+    """
+    if not (file_format is None or file_format in _reader_map):
+        raise ValueError()
+
+    with open_file(filename, "r") as f:
+        yield (f, *_get_file_type_format(f, file_format, connection))
+
+
+def _get_time_steps(filename, file_format, time_steps, times, time_range):
+    """Convert time selection to time steps."""
+    if times is None and time_range is None:
+        return time_steps
+
+    if sum(x is not None for x in (time_steps, times, time_range)) > 1:
+        raise ValueError(
+            "Only one of 'time_steps', 'times' and 'time_range' can be set."
+        )
+
+    if file_format not in _time_reader_map:
+        raise ValueError(
+            f"Selecting time steps by time is not supported for '{file_format}' files."
+        )
+
+    # Time of time steps is cached given the path, size and modification time of the file
+    index = get_time_step_index(filename, _time_reader_map[file_format])
+
+    if index is None:
+        raise ValueError("Selecting time steps by time requires a file name.")
+
+    return select_time_steps(
+        [time if time is not None else np.nan for time in index], times, time_range
+    )
+
+
+def _count_time_steps(filename, file_format, time_steps):
+    """Return the number of time steps to read if known without reading data."""
+    if time_steps is not None:
+        return len(time_steps) if np.ndim(time_steps) else 1
+
+    if file_format not in _time_reader_map:
+        return None
+
+    index = get_time_step_index(filename, _time_reader_map[file_format])
+
+    return len(index) if index is not None else None
+
+
+def _get_file_type_format(filename, file_format=None, connection=False):
+    """Get output file type and format."""
+    if file_format is None:
+        # Guess type and format from content
+        file_type, file_format = get_output_type(filename)
+
+        # Otherwise, guess file format from extension
+        file_format = (
+            file_format
+            if file_format
+            else filetype_from_filename(
+                get_path(filename) or filename, _extension_to_filetype, ""
+            )
+        )
+
+    else:
+        if file_format not in _reader_map:
+            raise ValueError()
+
+        file_type = "element"  # By default
+
+    if connection:
+        file_type = "connection" if connection else "element"
+
+    return file_type, file_format
+
+
 def get_output_type(filename):
     """Get output file type and format."""
     with open_file(filename, "r") as f:
-        line = f.readline().strip()
+        # Position of buffers is restored such that they can be passed to readers
+        position = f.tell()
+
+        try:
+            file_type, file_format = _sniff_output_type(f)
 
-        if not line:
-            line = f.readline().strip()
-            if line.startswith("@@@@@"):
-                file_format = "tough"
-                file_type = "element"
+        finally:
+            f.seek(position)
 
-            else:
-                raise ValueError()
+    return file_type, file_format
+
+
+def _sniff_output_type(f):
+    """Guess output file type and format from first lines."""
+    line = f.readline().strip()
 
-        elif line.startswith("1      @@@@@"):
+    if not line:
+        line = f.readline().strip()
+        if line.startswith("@@@@@"):
             file_format = "tough"
             file_type = "element"
 
-        elif line.startswith("INCON"):
-            file_format = "save"
-            file_type = "element"
+        else:
+            raise ValueError()
 
-        elif "=" in line:
-            file_format = "tecplot"
-            file_type = (
-                "connection"
-                if "HEAT" in line or "FLOW" in line or "VEL" in line
-                else "element"
-            )
+    elif line.startswith("1      @@@@@"):
+        file_format = "tough"
+        file_type = "element"
 
-        elif line.startswith("TIME"):
-            file_format = "petrasim"
-            file_type = "connection" if "ELEM1" in line else "element"
+    elif line.startswith("INCON"):
+        file_format = "save"
+        file_type = "element"
 
-        else:
-            header = line.split(",")[0].replace('"', "").strip()
-            file_format = "csv"
-            file_type = "connection" if header == "ELEM1" else "element"
+    elif "=" in line:
+        file_format = "tecplot"
+        file_type = (
+            "connection"
+            if "HEAT" in line or "FLOW" in line or "VEL" in line
+            else "element"
+        )
 
-            if header == "ELEM":
-                file_format = "csv"
-                file_type = "element"
+    elif line.startswith("TIME"):
+        file_format = "petrasim"
+        file_type = "connection" if "ELEM1" in line else "element"
 
-            elif header == "ELEM1":
-                file_format = "csv"
-                file_type = "connection"
+    else:
+        header = line.split(",")[0].replace('"', "").strip()
+        file_format = "csv"
+        file_type = "connection" if header == "ELEM1" else "element"
 
-            else:
-                file_format = "element"
-                file_type = None
+        if header == "ELEM":
+            file_format = "csv"
+            file_type = "element"
+
+        elif header == "ELEM1":
+            file_format = "csv"
+            file_type = "connection"
+
+        else:
+            file_format = "element"
+            file_type = None
 
     return file_type, file_format
@@ -1,10 +1,11 @@
 from .._helpers import register
-from ._csv import read, write
+from ._csv import iterate, read, read_times, write
 
 __all__ = [
     "read",
+    "iterate",
     "write",
 ]
 
 
-register("csv", [".csv"], read, write)
+register("csv", [".csv"], read, write, iterator=iterate, time_reader=read_times)
@@ -1,8 +1,31 @@
+import io
+import itertools
+from functools import partial
+
+import numpy as np
+
 from ...._common import open_file
-from .._common import ElementOutput, to_output
+from .._common import (
+    ElementOutput,
+    count_time_steps,
+    find_line,
+    get_columns,
+    get_path,
+    get_time_step_index,
+    get_time_steps,
+    index_lines,
+    map_parallel,
+    next_line,
+    read_bytes,
+    read_lines,
+    to_output,
+)
 
 __all__ = [
     "read",
+    "iterate",
+    "read_times",
+    "follow",
     "write",
 ]
 
@@ -30,7 +53,14 @@ header_to_unit = {
 }
 
 
-def read(filename, file_type, labels_order=None, time_steps=None):
+def read(
+    filename,
+    file_type,
+    labels_order=None,
+    time_steps=None,
+    variables=None,
+    workers=None,
+):
     """
     Read OUTPUT_{ELEME, CONNE}.csv.
 
@@ -44,6 +74,11 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         List of labels. If None, output will be assumed ordered.
     time_steps : int or sequence of int
         List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    workers : int or None, optional, default None
+        Number of processes used to parse time steps in parallel. If None, time steps
+        are parsed sequentially.
 
     Returns
     -------
@@ -51,30 +86,129 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         Output data for each time step.
 
     """
-    if time_steps is not None:
-        if isinstance(time_steps, int):
-            time_steps = [time_steps]
-
-        if any(i < 0 for i in time_steps):
-            n_steps = _count_time_steps(filename)
-            time_steps = [i if i >= 0 else n_steps + i for i in time_steps]
+    if workers:
+        index = get_time_step_index(filename, _index_time_steps)
+
+        if index is None:
+            raise ValueError("Parallel reading requires a file name.")
+
+        # Single time step files are read sequentially
+        if index:
+            return _read_parallel(
+                get_path(filename),
+                file_type,
+                labels_order,
+                time_steps,
+                variables,
+                workers,
+                index,
+            )
 
-        time_steps = set(time_steps)
+    time_steps = get_time_steps(
+        time_steps,
+        lambda: count_time_steps(filename, _count_time_steps, _index_time_steps),
+    )
 
     with open_file(filename, "r") as f:
-        headers, times, labels, data = _read_csv(f, file_type, time_steps)
+        headers, times, labels, data = _read_csv(f, file_type, time_steps, variables)
 
         return to_output(file_type, labels_order, headers, times, labels, data)
 
 
-def _read_csv(f, file_type, time_steps=None):
+def iterate(filename, file_type, labels_order=None, time_steps=None, variables=None):
+    """
+    Iterate over time steps of OUTPUT_{ELEME, CONNE}.csv.
+
+    Parameters
+    ----------
+    filename : str, pathlike or buffer
+        Input file name or buffer.
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+
+    Yields
+    ------
+    :class:`toughio.ElementOutput` or :class:`toughio.ConnectionOutput`
+        Output data for each time step.
+
+    """
+    time_steps = get_time_steps(
+        time_steps,
+        lambda: count_time_steps(filename, _count_time_steps, _index_time_steps),
+    )
+
+    with open_file(filename, "r") as f:
+        for headers, time, labels, data in _iter_csv(
+            f, file_type, time_steps, variables
+        ):
+            yield to_output(file_type, labels_order, headers, [time], [labels], [data])
+
+
+def _read_parallel(
+    filename, file_type, labels_order, time_steps, variables, workers, index
+):
+    """Read time steps of CSV table in parallel given byte ranges."""
+    time_steps = get_time_steps(time_steps, lambda: len(index))
+    time_steps = time_steps if time_steps is not None else range(len(index))
+    time_steps = [i for i in sorted(time_steps) if 0 <= i < len(index)]
+
+    # Header and unit lines are prepended to each time step
+    with open(filename, "r") as f:
+        header = f.readline() + f.readline()
+
+    tables = map_parallel(
+        partial(_read_time_step, filename, file_type, variables, header),
+        workers,
+        [index[i] for i in time_steps],
+    )
+
+    headers, times, labels, data = None, [], [], []
+    for headers, time, labels_, data_ in tables:
+        times.append(time)
+        labels.append(labels_)
+        data.append(data_)
+
+    return to_output(file_type, labels_order, headers, times, labels, data)
+
+
+def _read_time_step(filename, file_type, variables, header, index):
+    """Read a time step of CSV table in a separate process."""
+    f = io.StringIO(header + read_bytes(filename, *index), newline=None)
+    headers, time, labels, data = next(_iter_csv(f, file_type, None, variables))
+
+    return headers, time, labels, np.array(data)
+
+
+def _read_csv(f, file_type, time_steps=None, variables=None):
     """Read CSV table."""
+    times, labels, data = [], [], []
+    headers = None
+
+    for headers, time, labels_, data_ in _iter_csv(f, file_type, time_steps, variables):
+        times.append(time)
+        labels.append(labels_)
+        data.append(data_)
+
+    return headers, times, labels, data
+
+
+def _iter_csv(f, file_type, time_steps=None, variables=None):
+    """Iterate over time steps of CSV table."""
     # Label index
     ilab = 1 if file_type == "element" else 2
 
     # Read header
     line = f.readline().replace('"', "")
     headers = [l.strip() for l in line.split(",")[ilab:]]
+    n_cols = len(headers)
+    headers, columns = get_columns(headers, variables)
+    columns = [ilab + i for i in (columns if columns is not None else range(n_cols))]
 
     # Skip second line (unit)
     line = f.readline()
@@ -86,41 +220,52 @@ def _read_csv(f, file_type, time_steps=None):
     # Read data
     if single:
         t_step = 0
-        times, labels, data = [None], [[]], [[]]
+        time, lines = None, [line] if line.strip() else []
 
     else:
         t_step = -1
-        times, labels, data = [], [], []
-
-    while line:
-        line = line.split(",")
+        time, lines = None, None
+        f = itertools.chain([line], f)
 
+    # Data lines of a time step are gathered and parsed at once
+    for line in f:
         # Time step
-        if line[0].startswith('"TIME [sec]'):
+        if line.startswith('"TIME [sec]'):
+            if lines is not None:
+                yield (headers, time, *_parse_lines(lines, ilab, columns))
+                lines = None
+
             t_step += 1
 
             if time_steps is not None and t_step > max(time_steps):
                 break
 
             if time_steps is None or t_step in time_steps:
-                line = line[0].replace('"', "").split()
-                times.append(float(line[-1]))
-                labels.append([])
-                data.append([])
+                time = float(line.split(",")[0].replace('"', "").split()[-1])
+                lines = []
 
         # Output
-        elif time_steps is None or t_step in time_steps:
-            if ilab == 1:
-                labels[-1].append(line[0].replace('"', "").strip())
+        elif lines is not None and line.strip():
+            lines.append(line)
 
-            else:
-                labels[-1].append([l.replace('"', "").strip() for l in line[:ilab]])
+    if lines is not None:
+        yield (headers, time, *_parse_lines(lines, ilab, columns))
 
-            data[-1].append([float(l.strip()) for l in line[ilab:]])
 
-        line = f.readline()
+def _parse_lines(lines, ilab, columns):
+    """Parse labels and data of a time step."""
+    if not lines:
+        return [], np.empty((0, len(columns)))
 
-    return headers, times, labels, data
+    labels = [line.split(",", ilab)[:ilab] for line in lines]
+    labels = (
+        [label[0].replace('"', "").strip() for label in labels]
+        if ilab == 1
+        else [[l.replace('"', "").strip() for l in label] for label in labels]
+    )
+    data = np.loadtxt(lines, delimiter=",", usecols=columns, ndmin=2)
+
+    return labels, data
 
 
 def write(filename, output, unit=None):
@@ -194,3 +339,104 @@ def _count_time_steps(filename):
             count += int(line.startswith('"TIME [sec]'))
 
     return count
+
+
+def _index_time_steps(filename):
+    """Index byte ranges of time steps."""
+    return index_lines(filename, b'"TIME [sec]')
+
+
+def read_times(filename):
+    """
+    Read time of each time step of OUTPUT_{ELEME, CONNE}.csv.
+
+    Only the lines starting time steps are decoded.
+
+    Parameters
+    ----------
+    filename : str or pathlike
+        Input file name.
+
+    Returns
+    -------
+    list
+        Time of each time step.
+
+    """
+    index = get_time_step_index(filename, _index_time_steps)
+    lines = read_lines(filename, [start for start, _ in index])
+
+    return [float(line.split(",")[0].replace('"', "").split()[-1]) for line in lines]
+
+
+def follow(mm, offset, state, file_type, labels_order=None, variables=None):
+    """
+    Read completed time steps of a growing OUTPUT_{ELEME, CONNE}.csv.
+
+    The last time step is considered complete once it has as many records as the
+    previous time step, or if ``state["final"]`` is `True` (i.e., the file is no
+    longer written).
+
+    Parameters
+    ----------
+    mm : mmap.mmap
+        Memory-mapped file.
+    offset : int
+        Byte offset from which to look for new time steps.
+    state : dict
+        Parser state (updated in place).
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+
+    Returns
+    -------
+    list
+        Output data of completed time steps.
+    int
+        Byte offset of first incomplete time step.
+
+    """
+    key = b'"TIME [sec]'
+    outputs = []
+
+    # Header and unit lines are prepended to each time step
+    if "header" not in state:
+        start = find_line(mm, key)
+        if start is None:
+            return outputs, offset
+
+        state["header"] = mm[:start].decode()
+        offset = start
+
+    while True:
+        start = find_line(mm, key, offset)
+        if start is None:
+            break
+
+        end = find_line(mm, key, next_line(mm, start))
+
+        if end is None:
+            # Ignore incomplete last line unless the file is no longer written
+            end = len(mm) if state.get("final") else mm.rfind(b"\n") + 1
+            n_rows = mm[start:end].count(b"\n") - 1
+
+            if not state.get("final") and n_rows < state.get("n_rows", n_rows + 1):
+                break
+
+            if n_rows < 1:
+                break
+
+        f = io.StringIO(state["header"] + mm[start:end].decode(), newline=None)
+        headers, time, labels, data = next(_iter_csv(f, file_type, None, variables))
+        state["n_rows"] = len(labels)
+
+        outputs.append(
+            to_output(file_type, labels_order, headers, [time], [labels], [data])
+        )
+        offset = end
+
+    return outputs, offset
@@ -1,10 +1,11 @@
 from .._helpers import register
-from ._petrasim import read, write
+from ._petrasim import iterate, read, read_times, write
 
 __all__ = [
     "read",
+    "iterate",
     "write",
 ]
 
 
-register("petrasim", [], read, write)
+register("petrasim", [], read, write, iterator=iterate, time_reader=read_times)
@@ -1,15 +1,23 @@
 import numpy as np
 
 from ...._common import open_file
-from .._common import ElementOutput, to_output
+from .._common import (
+    ElementOutput,
+    count_time_steps,
+    get_columns,
+    get_time_steps,
+    to_output,
+)
 
 __all__ = [
     "read",
+    "iterate",
+    "read_times",
     "write",
 ]
 
 
-def read(filename, file_type, labels_order=None, time_steps=None):
+def read(filename, file_type, labels_order=None, time_steps=None, variables=None):
     """
     Read Petrasim OUTPUT_ELEME.csv.
 
@@ -23,6 +31,8 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         List of labels. If None, output will be assumed ordered.
     time_steps : int or sequence of int
         List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
 
     Returns
     -------
@@ -30,70 +40,109 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         Output data for each time step.
 
     """
-    if time_steps is not None:
-        if isinstance(time_steps, int):
-            time_steps = [time_steps]
+    time_steps = get_time_steps(
+        time_steps, lambda: count_time_steps(filename, _count_time_steps)
+    )
+
+    with open_file(filename, "r") as f:
+        times, labels, data = [], [], []
+
+        for headers, time, labels_, data_ in _iter_petrasim(
+            f, file_type, time_steps, variables
+        ):
+            times.append(time)
+            labels.append(labels_)
+            data.append(data_)
+
+    return to_output(file_type, labels_order, headers, times, labels, data)
 
-        if any(i < 0 for i in time_steps):
-            n_steps = _count_time_steps(filename)
-            time_steps = [i if i >= 0 else n_steps + i for i in time_steps]
 
-        time_steps = set(time_steps)
+def iterate(filename, file_type, labels_order=None, time_steps=None, variables=None):
+    """
+    Iterate over time steps of Petrasim OUTPUT_ELEME.csv.
+
+    Parameters
+    ----------
+    filename : str, pathlike or buffer
+        Input file name or buffer.
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+
+    Yields
+    ------
+    :class:`toughio.ElementOutput` or :class:`toughio.ConnectionOutput`
+        Output data for each time step.
+
+    """
+    time_steps = get_time_steps(
+        time_steps, lambda: count_time_steps(filename, _count_time_steps)
+    )
 
     with open_file(filename, "r") as f:
-        # Label index
-        ilab = 3 if file_type == "element" else 4
+        for headers, time, labels, data in _iter_petrasim(
+            f, file_type, time_steps, variables
+        ):
+            yield to_output(file_type, labels_order, headers, [time], [labels], [data])
 
-        # Headers
-        line = f.readline().strip()
-        headers = [header.strip() for header in line.split(",")[ilab:]]
 
-        # Data
-        t_step = -1
-        count, tcur, offset = 0, None, []
-        times, labels, data = [], [], []
+def _iter_petrasim(f, file_type, time_steps=None, variables=None):
+    """Iterate over time steps of Petrasim table."""
+    # Label index
+    ilab = 3 if file_type == "element" else 4
+
+    # Headers
+    line = f.readline().strip()
+    headers = [header.strip() for header in line.split(",")[ilab:]]
+    headers, columns = get_columns(headers, variables)
+
+    # Data
+    t_step = -1
+    tcur = None
+    labels, data = None, None
 
-        while True:
-            line = f.readline().strip()
+    while True:
+        line = f.readline().strip()
 
-            if line:
-                line = line.split(",")
+        if line:
+            line = line.split(",")
 
-                if line[0] != tcur:
-                    t_step += 1
+            if line[0] != tcur:
+                if labels is not None:
+                    yield headers, float(tcur), labels, data
+                    labels, data = None, None
 
-                    if time_steps is not None and t_step > max(time_steps):
-                        break
+                t_step += 1
 
-                    tcur = line[0]
+                if time_steps is not None and t_step > max(time_steps):
+                    break
 
-                    if time_steps is None or t_step in time_steps:
-                        offset.append(count)
-                        times.append(float(tcur))
+                tcur = line[0]
 
                 if time_steps is None or t_step in time_steps:
-                    if file_type == "element":
-                        labels.append(line[1].strip())
+                    labels, data = [], []
 
-                    else:
-                        labels.append([line[1].strip(), line[2].strip()])
+            if time_steps is None or t_step in time_steps:
+                if file_type == "element":
+                    labels.append(line[1].strip())
 
-                    data.append([float(x) for x in line[ilab:]])
-                    count += 1
+                else:
+                    labels.append([line[1].strip(), line[2].strip()])
 
-            else:
-                break
+                line = line[ilab:]
+                line = line if columns is None else [line[i] for i in columns]
+                data.append([float(x) for x in line])
 
-        offset.append(count)
+        else:
+            break
 
-    return to_output(
-        file_type,
-        labels_order,
-        headers,
-        times,
-        [labels[i1:i2] for i1, i2 in zip(offset[:-1], offset[1:])],
-        [data[i1:i2] for i1, i2 in zip(offset[:-1], offset[1:])],
-    )
+    if labels is not None:
+        yield headers, float(tcur), labels, data
 
 
 def write(filename, output):
@@ -154,3 +203,29 @@ def _count_time_steps(filename):
         x = np.genfromtxt(f, delimiter=",", skip_header=1, usecols=0)
 
     return np.unique(x).size
+
+
+def read_times(filename):
+    """
+    Read time of each time step of Petrasim OUTPUT_ELEME.csv.
+
+    Only the first column is decoded.
+
+    Parameters
+    ----------
+    filename : str or pathlike
+        Input file name.
+
+    Returns
+    -------
+    list
+        Time of each time step.
+
+    """
+    with open_file(filename, "r") as f:
+        x = np.atleast_1d(np.genfromtxt(f, delimiter=",", skip_header=1, usecols=0))
+
+    # Time steps are ordered by first occurrence
+    _, idx = np.unique(x, return_index=True)
+
+    return x[np.sort(idx)].tolist()
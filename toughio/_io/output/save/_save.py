@@ -1,14 +1,18 @@
+import io
+
 import numpy as np
 
+from ...._common import block_to_format, get_label_length, open_file
+from ..._common import read_record, to_float
 from ...input import tough
-from .._common import ElementOutput
+from .._common import ElementOutput, get_columns
 
 __all__ = [
     "read",
 ]
 
 
-def read(filename, file_type=None, labels_order=None, time_steps=None):
+def read(filename, file_type=None, labels_order=None, time_steps=None, variables=None):
     """
     Read SAVE file.
 
@@ -22,6 +26,8 @@ def read(filename, file_type=None, labels_order=None, time_steps=None):
         List of labels. If None, output will be assumed ordered.
     time_steps : int or sequence of int
         List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
 
     Returns
     -------
@@ -29,7 +35,95 @@ def read(filename, file_type=None, labels_order=None, time_steps=None):
         Output data.
 
     """
-    parameters = tough.read(filename)
+    with open_file(filename, "r") as f:
+        text = f.read()
+
+    # Records are parsed column-wise if all the elements have the same number of lines
+    try:
+        time, labels, data = _read_save(text)
+
+    except ValueError:
+        time, labels, data = _read_parameters(text)
+
+    if variables is not None:
+        headers, _ = get_columns(list(data), variables)
+        data = {k: data[k] for k in headers}
+
+    output = ElementOutput(time, data, labels)
+
+    return output
+
+
+def _read_save(text):
+    """Read SAVE file by decoding fixed-width fields of all records at once."""
+    # End of records
+    ends = [text.find(key) for key in ("\n+++", "\n\n")]
+    end = min([i for i in ends if i >= 0], default=len(text))
+    lines = text[:end].splitlines()
+    lines = lines[1:] if lines and lines[0].startswith("INCON") else lines
+
+    if not lines:
+        raise ValueError()
+
+    # Number of lines of primary variables (record 2) per element
+    fmt = block_to_format["INCON"][0]
+    n_lines = 1
+
+    while n_lines < len(lines):
+        try:
+            read_record(lines[n_lines], fmt)
+
+        except ValueError:
+            break
+
+        n_lines += 1
+
+    n_lines -= 1
+    if not n_lines or len(lines) % (n_lines + 1):
+        raise ValueError()
+
+    # Record 1
+    label_length = get_label_length(lines[0][:9])
+    record = lines[:: n_lines + 1]
+    labels = [line[:label_length].strip().rjust(label_length) for line in record]
+
+    record = _to_bytes(record, 90)
+    data = {"porosity": _to_float(record[:, 15:30], 15)[:, 0]}
+    userx = _to_float(record[:, 30:90], 10)
+
+    # Record 2
+    record = np.hstack(
+        [_to_bytes(lines[i :: n_lines + 1], 80) for i in range(1, n_lines + 1)]
+    )
+    values = _to_float(record, 20)
+
+    # Primary variables and userx are pruned to the last non-blank column
+    data = {
+        **{f"X{i + 1}": x for i, x in enumerate(_prune_columns(values).T)},
+        **data,
+    }
+
+    userx = _prune_columns(userx)
+    if userx.shape[1]:
+        data["userx"] = userx
+
+    # Time is the last value of the first line following "+++"
+    try:
+        time = (
+            float(text[end + 1 :].splitlines()[1].split()[-1])
+            if text.startswith("\n+++", end)
+            else None
+        )
+
+    except (IndexError, ValueError):
+        time = None
+
+    return time, labels, data
+
+
+def _read_parameters(text):
+    """Read SAVE file using TOUGH input file parser."""
+    parameters = tough.read(io.StringIO(text))
 
     data = [v["values"] for v in parameters["initial_conditions"].values()]
     data = {f"X{i + 1}": x for i, x in enumerate(np.transpose(data))}
@@ -50,6 +144,42 @@ def read(filename, file_type=None, labels_order=None, time_steps=None):
     except Exception:
         time = None
 
-    output = ElementOutput(time, data, labels)
+    return time, labels, data
 
-    return output
+
+def _to_bytes(lines, width):
+    """Convert lines to an array of characters with fixed width."""
+    text = "".join(line[:width].ljust(width) for line in lines)
+
+    return np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8).reshape(
+        (len(lines), width)
+    )
+
+
+def _to_float(record, width):
+    """Convert fixed-width fields to floats (blank fields are converted to NaN)."""
+    record = np.ascontiguousarray(record)
+    fields = record.view(f"S{width}")
+
+    # Blank fields are replaced by "nan"
+    blank = (record.reshape((*fields.shape, width)) == ord(" ")).all(axis=-1)
+    if blank.any():
+        fields = fields.copy()
+        fields[blank] = b"nan"
+
+    try:
+        return fields.astype(float)
+
+    except ValueError:
+        # Values like "0.0001-001"
+        data = [to_float(x.decode()) for x in fields.ravel()]
+
+        return np.reshape(data, fields.shape)
+
+
+def _prune_columns(data):
+    """Remove trailing columns with only NaN values."""
+    mask = ~np.isnan(data).all(axis=0)
+    n_columns = mask.nonzero()[0][-1] + 1 if mask.any() else 0
+
+    return data[:, :n_columns]
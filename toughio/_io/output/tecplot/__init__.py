@@ -1,10 +1,11 @@
 from .._helpers import register
-from ._tecplot import read, write
+from ._tecplot import iterate, read, read_times, write
 
 __all__ = [
     "read",
+    "iterate",
     "write",
 ]
 
 
-register("tecplot", [".tec"], read, write)
+register("tecplot", [".tec"], read, write, iterator=iterate, time_reader=read_times)
@@ -1,10 +1,32 @@
+import collections
+import io
+import itertools
+import warnings
+from functools import partial
+
 import numpy as np
 
 from ...._common import open_file
-from .._common import to_output
+from .._common import (
+    count_time_steps,
+    find_line,
+    get_columns,
+    get_path,
+    get_time_step_index,
+    get_time_steps,
+    index_lines,
+    map_parallel,
+    next_line,
+    read_bytes,
+    read_lines,
+    to_output,
+)
 
 __all__ = [
     "read",
+    "iterate",
+    "read_times",
+    "follow",
     "write",
 ]
 
@@ -28,7 +50,14 @@ zone_key_to_type = {
 }
 
 
-def read(filename, file_type, labels_order=None, time_steps=None):
+def read(
+    filename,
+    file_type,
+    labels_order=None,
+    time_steps=None,
+    variables=None,
+    workers=None,
+):
     """
     Read OUTPUT_ELEME.tec.
 
@@ -42,6 +71,11 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         List of labels. If None, output will be assumed ordered.
     time_steps : int or sequence of int
         List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    workers : int or None, optional, default None
+        Number of processes used to parse zones in parallel. If None, zones are parsed
+        sequentially.
 
     Returns
     -------
@@ -49,18 +83,32 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         Output data for each time step.
 
     """
-    if time_steps is not None:
-        if isinstance(time_steps, int):
-            time_steps = [time_steps]
+    # Zones are read by seeking given byte ranges if only a few are required
+    index = (
+        get_time_step_index(filename, _index_time_steps)
+        if workers or time_steps is not None
+        else None
+    )
 
-        if any(i < 0 for i in time_steps):
-            n_steps = _count_time_steps(filename)
-            time_steps = [i if i >= 0 else n_steps + i for i in time_steps]
+    if workers and index is None:
+        raise ValueError("Parallel reading requires a file name.")
 
-        time_steps = set(time_steps)
+    if index is not None:
+        headers, zones = None, []
 
-    with open_file(filename, "r") as f:
-        headers, zones = read_buffer(f, time_steps)
+        for headers, zone in _read_zones_index(
+            get_path(filename), index, time_steps, variables, workers
+        ):
+            zones.append(zone)
+
+    else:
+        time_steps = get_time_steps(
+            time_steps,
+            lambda: count_time_steps(filename, _count_time_steps, _index_time_steps),
+        )
+
+        with open_file(filename, "r") as f:
+            headers, zones = read_buffer(f, time_steps, variables)
 
     times, labels, data = [], [], []
     for zone in zones:
@@ -73,10 +121,96 @@ def read(filename, file_type, labels_order=None, time_steps=None):
     return to_output(file_type, labels_order, headers, times, labels, data)
 
 
-def read_buffer(f, time_steps=None):
+def iterate(filename, file_type, labels_order=None, time_steps=None, variables=None):
+    """
+    Iterate over time steps of OUTPUT_ELEME.tec.
+
+    Parameters
+    ----------
+    filename : str, pathlike or buffer
+        Input file name or buffer.
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+
+    Yields
+    ------
+    :class:`toughio.ElementOutput` or :class:`toughio.ConnectionOutput`
+        Output data for each time step.
+
+    """
+    index = (
+        get_time_step_index(filename, _index_time_steps)
+        if time_steps is not None
+        else None
+    )
+
+    if index is not None:
+        zones = _read_zones_index(get_path(filename), index, time_steps, variables)
+
+    else:
+        time_steps = get_time_steps(
+            time_steps,
+            lambda: count_time_steps(filename, _count_time_steps, _index_time_steps),
+        )
+        zones = _iter_buffer_file(filename, time_steps, variables)
+
+    for headers, zone in zones:
+        time = float(zone["title"].split()[0]) if "title" in zone else None
+
+        yield to_output(file_type, labels_order, headers, [time], [[]], [zone["data"]])
+
+
+def _iter_buffer_file(filename, time_steps=None, variables=None):
+    """Iterate over zones of OUTPUT_ELEME.tec given a file name or buffer."""
+    with open_file(filename, "r") as f:
+        yield from iter_buffer(f, time_steps, variables)
+
+
+def _read_zones_index(filename, index, time_steps=None, variables=None, workers=None):
+    """Read zones of OUTPUT_ELEME.tec given byte ranges."""
+    time_steps = get_time_steps(time_steps, lambda: len(index))
+    time_steps = time_steps if time_steps is not None else range(len(index))
+    time_steps = [i for i in sorted(time_steps) if 0 <= i < len(index)]
+
+    with open(filename, "rb") as f:
+        # Variables are defined before first zone
+        header = f.read(index[0][0]).decode() if index else ""
+
+        if not workers:
+            for i in time_steps:
+                start, end = index[i]
+                f.seek(start)
+                f_ = io.StringIO(header + f.read(end - start).decode(), newline=None)
+
+                yield next(iter_buffer(f_, None, variables))
+
+            return
+
+    yield from map_parallel(
+        partial(_read_zone_file, filename, variables, header),
+        workers,
+        [index[i] for i in time_steps],
+    )
+
+
+def read_buffer(f, time_steps=None, variables=None):
     """Read OUTPUT_ELEME.tec."""
-    zones = []
+    headers, zones = None, []
+
+    for headers, zone in iter_buffer(f, time_steps, variables):
+        zones.append(zone)
+
+    return headers, zones
+
 
+def iter_buffer(f, time_steps=None, variables=None):
+    """Iterate over zones of OUTPUT_ELEME.tec."""
     # Loop until end of file
     t_step = -1
 
@@ -86,6 +220,8 @@ def read_buffer(f, time_steps=None):
         # Read header (VARIABLES)
         if line.upper().startswith("VARIABLES"):
             headers = _read_variables(line)
+            n_columns = len(headers)
+            headers, columns = get_columns(headers, variables)
 
         # Read zone
         elif line.upper().startswith("ZONE"):
@@ -102,21 +238,48 @@ def read_buffer(f, time_steps=None):
 
             if time_steps is None or t_step in time_steps:
                 # Read data
-                data = np.genfromtxt(f, max_rows=zone["I"])
+                data = _read_zone_data(f, zone["I"], n_columns, columns)
 
                 # Output
                 tmp = {"data": data}
                 tmp["title"] = zone["T"]
-                zones.append(tmp)
+                yield headers, tmp
 
             else:
-                for _ in range(zone["I"]):
-                    _ = f.readline()
+                collections.deque(itertools.islice(f, zone["I"]), maxlen=0)
 
         elif not line:
             break
 
-    return headers, zones
+
+def _read_zone_data(f, n_rows, n_columns, columns=None):
+    """Read data of a zone in bulk."""
+    lines = list(itertools.islice(f, n_rows))
+
+    # Fall back to genfromtxt if some values could not be decoded (e.g., 3.0-100)
+    # Depending on NumPy version, fromstring either raises or stops at invalid values
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            data = np.fromstring("".join(lines), sep=" ")
+
+    except ValueError:
+        data = None
+
+    if data is not None and data.size == n_rows * n_columns:
+        data = data.reshape((n_rows, n_columns))
+
+    else:
+        data = np.reshape(np.genfromtxt(lines), (len(lines), -1))
+
+    return data[:, columns] if columns is not None else data
+
+
+def _read_zone_file(filename, variables, header, index):
+    """Read a zone in a separate process."""
+    f = io.StringIO(header + read_bytes(filename, *index), newline=None)
+
+    return next(iter_buffer(f, None, variables))
 
 
 def write(filename, output):
@@ -251,3 +414,102 @@ def _count_time_steps(filename):
             count += int(line.strip().upper().startswith("ZONE"))
 
     return count
+
+
+def _index_time_steps(filename):
+    """Index byte ranges of zones."""
+    return index_lines(filename, b"ZONE", ignore_case=True)
+
+
+def read_times(filename):
+    """
+    Read time of each zone of OUTPUT_ELEME.tec.
+
+    Only the zone headers are decoded.
+
+    Parameters
+    ----------
+    filename : str or pathlike
+        Input file name.
+
+    Returns
+    -------
+    list
+        Time of each zone (None if zone has no title).
+
+    """
+    index = get_time_step_index(filename, _index_time_steps)
+    zones = [
+        _read_zone(line.strip())
+        for line in read_lines(filename, [start for start, _ in index])
+    ]
+
+    return [float(zone["T"].split()[0]) if "T" in zone else None for zone in zones]
+
+
+def follow(mm, offset, state, file_type, labels_order=None, variables=None):
+    """
+    Read completed zones of a growing OUTPUT_ELEME.tec.
+
+    Parameters
+    ----------
+    mm : mmap.mmap
+        Memory-mapped file.
+    offset : int
+        Byte offset from which to look for new zones.
+    state : dict
+        Parser state (updated in place).
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+
+    Returns
+    -------
+    list
+        Output data of completed zones.
+    int
+        Byte offset of first incomplete zone.
+
+    """
+    outputs = []
+
+    # Variables are defined before first zone
+    if "header" not in state:
+        start = find_line(mm, b"ZONE", ignore_case=True)
+        if start is None:
+            return outputs, offset
+
+        state["header"] = mm[:start].decode()
+        offset = start
+
+    while True:
+        start = find_line(mm, b"ZONE", offset, ignore_case=True)
+        if start is None or mm.find(b"\n", start) < 0:
+            break
+
+        # Zone is complete once all its records have been written
+        end = next_line(mm, start)
+        zone = _read_zone(mm[start:end].decode().strip())
+
+        for _ in range(zone["I"]):
+            end = mm.find(b"\n", end) + 1
+
+            if not end:
+                break
+
+        if not end:
+            break
+
+        f = io.StringIO(state["header"] + mm[start:end].decode(), newline=None)
+        headers, zone = next(iter_buffer(f, None, variables))
+        time = float(zone["title"].split()[0]) if "title" in zone else None
+
+        outputs.append(
+            to_output(file_type, labels_order, headers, [time], [[]], [zone["data"]])
+        )
+        offset = end
+
+    return outputs, offset
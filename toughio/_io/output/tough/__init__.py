@@ -1,9 +1,10 @@
 from .._helpers import register
-from ._tough import read
+from ._tough import iterate, read, read_times
 
 __all__ = [
     "read",
+    "iterate",
 ]
 
 
-register("tough", ["", ".out"], read)
+register("tough", ["", ".out"], read, iterator=iterate, time_reader=read_times)
@@ -1,17 +1,44 @@
+import io
+import mmap
 from functools import partial
 
 import numpy as np
 
 from ...._common import open_file
-from ..._common import read_record, to_float
-from .._common import to_output
+from ..._common import read_record, to_float, to_float_array
+from .._common import (
+    LazyOutput,
+    count_time_steps,
+    find_line,
+    get_columns,
+    get_path,
+    get_time_step_index,
+    get_time_steps,
+    index_lines,
+    map_parallel,
+    next_line,
+    to_labels,
+    to_output,
+)
 
 __all__ = [
     "read",
+    "iterate",
+    "read_times",
+    "follow",
 ]
 
 
-def read(filename, file_type, labels_order=None, time_steps=None):
+def read(
+    filename,
+    file_type,
+    labels_order=None,
+    time_steps=None,
+    variables=None,
+    engine="python",
+    lazy=False,
+    workers=None,
+):
     """
     Read standard TOUGH output file.
 
@@ -25,6 +52,20 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         List of labels. If None, output will be assumed ordered.
     time_steps : int or sequence of int
         List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    engine : {'python', 'fast'}, optional, default 'python'
+        Parsing engine for data tables. 'python' parses data tables line by line.
+        'fast' infers the column layout from the first record and decodes all the
+        records of a data table at once (falls back to 'python' if the table is not
+        fixed-width).
+    lazy : bool, optional, default False
+        If `True`, return a sequence-like object that reads time steps on first access
+        from the memory-mapped file and only keeps the most recently accessed time
+        steps in memory.
+    workers : int or None, optional, default None
+        Number of processes used to parse time steps in parallel. If None, time steps
+        are parsed sequentially.
 
     Returns
     -------
@@ -32,72 +73,235 @@ def read(filename, file_type, labels_order=None, time_steps=None):
         Output data for each time step.
 
     """
-    if time_steps is not None:
-        if isinstance(time_steps, int):
-            time_steps = [time_steps]
+    if engine not in {"python", "fast"}:
+        raise ValueError()
+
+    # Use byte offsets of time steps to only read selected data tables
+    index = (
+        get_time_step_index(filename, _index_time_steps)
+        if time_steps is not None or lazy or workers
+        else None
+    )
+
+    if lazy and index is None:
+        raise ValueError("Lazy reading requires a file name.")
+
+    if workers and index is None:
+        raise ValueError("Parallel reading requires a file name.")
+
+    time_steps = get_time_steps(
+        time_steps,
+        lambda: (
+            len(index)
+            if index is not None
+            else count_time_steps(filename, _count_time_steps)
+        ),
+    )
+
+    if lazy or workers:
+        time_steps = time_steps if time_steps is not None else range(len(index))
+        time_steps = [i for i in sorted(time_steps) if 0 <= i < len(index)]
+
+    if lazy:
+        with open(get_path(filename), "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        reader = lambda i: _read_time_step(
+            mm, index[time_steps[i]], file_type, labels_order, variables, engine
+        )
+
+        return LazyOutput(reader, [index[i][0] for i in time_steps], close=mm.close)
+
+    if workers:
+        # Labels are only returned for first time step
+        tables = map_parallel(
+            partial(_read_table_file, get_path(filename), file_type, variables, engine),
+            workers,
+            [index[i] for i in time_steps],
+            [i == 0 for i in range(len(time_steps))],
+        )
+
+    else:
+        with open_file(filename, "r") as f:
+            tables = list(
+                _read_table_index(f, file_type, index, time_steps, variables, engine)
+                if index is not None
+                else _read_table(f, file_type, time_steps, variables, engine)
+            )
+
+    times, labels, data = [], [], []
+    for time, headers, labels_, data_ in tables:
+        times.append(time)
+        labels.append(labels_)
+        data.append(data_)
+
+    headers, labels = _postprocess(headers, labels[0], file_type)
+    labels = [labels] * len(data)
+    data = np.array(data)
+
+    return to_output(file_type, labels_order, headers, times, labels, data)
 
-        if any(i < 0 for i in time_steps):
-            n_steps = _count_time_steps(filename)
-            time_steps = [i if i >= 0 else n_steps + i for i in time_steps]
 
-        time_steps = set(time_steps)
+def iterate(
+    filename,
+    file_type,
+    labels_order=None,
+    time_steps=None,
+    variables=None,
+    engine="python",
+):
+    """
+    Iterate over time steps of standard TOUGH output file.
+
+    Parameters
+    ----------
+    filename : str, pathlike or buffer
+        Input file name or buffer.
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    time_steps : int or sequence of int
+        List of time steps to read. If None, all time steps will be read.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    engine : {'python', 'fast'}, optional, default 'python'
+        Parsing engine for data tables.
+
+    Yields
+    ------
+    :class:`toughio.ElementOutput` or :class:`toughio.ConnectionOutput`
+        Output data for each time step.
+
+    """
+    if engine not in {"python", "fast"}:
+        raise ValueError()
+
+    index = (
+        get_time_step_index(filename, _index_time_steps)
+        if time_steps is not None
+        else None
+    )
+    time_steps = get_time_steps(
+        time_steps,
+        lambda: (
+            len(index)
+            if index is not None
+            else count_time_steps(filename, _count_time_steps)
+        ),
+    )
 
     with open_file(filename, "r") as f:
-        headers, times, data = _read_table(f, file_type, time_steps)
+        tables = (
+            _read_table_index(f, file_type, index, time_steps, variables, engine)
+            if index is not None
+            else _read_table(f, file_type, time_steps, variables, engine)
+        )
 
-        # Postprocess labels
-        labels = [v[0].lstrip() for v in data[0]]
+        # Labels are only postprocessed when they differ from previous time step
+        labels_prev = None
 
-        if file_type == "element":
-            label_length = max(len(label) for label in labels)
-            fmt = f"{{:>{label_length}}}"
-            labels = [fmt.format(label) for label in labels]
+        for time, headers, labels, data in tables:
+            if labels != labels_prev:
+                labels_prev = labels
+                headers_, labels_ = _postprocess(headers, labels, file_type)
+                labels_ = to_labels(labels_)
 
-        else:
-            # Find end of first element processing backward
-            labels = [label[::-1] for label in labels]
-            tmp = max(labels, key=len)
+            yield to_output(
+                file_type, labels_order, headers_, [time], [labels_], [data]
+            )
 
-            while True:
-                iend = tmp.index(" ")
 
-                if iend < 2:
-                    tmp = f"{tmp[:iend]}0{tmp[iend + 1:]}"
+def _read_time_step(
+    mm, index, file_type, labels_order=None, variables=None, engine="python"
+):
+    """Read data table of a time step from memory-mapped file."""
+    time, headers, labels, data = _read_table_mmap(
+        mm, index, file_type, variables, engine
+    )
+    headers, labels = _postprocess(headers, labels, file_type)
 
-                else:
-                    break
+    return to_output(file_type, labels_order, headers, [time], [labels], [data])
 
-            iend += len(tmp[iend:]) - len(tmp[iend:].lstrip())
 
-            # Split connection names
-            labels1 = [label[iend:].rstrip() for label in labels]
-            labels2 = [label[:iend].rstrip() for label in labels]
+def _read_table_mmap(mm, index, file_type, variables=None, engine="python"):
+    """Read data table of a time step given its byte offset."""
+    time, offsets = index
+    if offsets[file_type] is None:
+        raise ValueError(f"No data related to {file_type}s found.")
 
-            # Find label length
-            len1 = max(len(label) for label in labels1)
-            len2 = max(len(label) for label in labels2)
-            label_length = max(len1, len2)
+    # Data table ends at first line starting with "@@@@@"
+    start = offsets[file_type]
+    end = find_line(mm, b"@@@@@", start)
+    end = next_line(mm, end) if end is not None else len(mm)
 
-            # Correct element names given label length
-            fmt = f"{{:<{label_length}}}"
-            labels1 = [fmt.format(label) for label in labels1]
-            labels2 = [fmt.format(label) for label in labels2]
-            labels = [[l1[::-1], l2[::-1]] for l1, l2 in zip(labels1, labels2)]
+    f = io.StringIO(mm[start:end].decode(), newline=None)
 
-        ilab = 1 if file_type == "element" else 2
-        headers = headers[ilab + 1 :]
-        labels = [labels.copy() for _ in data]
-        data = np.array([[v[2:] for v in data] for data in data])
+    return (time, *_read_block(f, next(f).strip(), variables, engine))
 
-    return to_output(file_type, labels_order, headers, times, labels, data)
 
+def _read_table_file(filename, file_type, variables, engine, index, with_labels=True):
+    """Read data table of a time step in a separate process."""
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            time, headers, labels, data = _read_table_mmap(
+                mm, index, file_type, variables, engine
+            )
+
+    return time, headers, labels if with_labels else None, data
+
+
+def _postprocess(headers, labels, file_type):
+    """Postprocess headers and labels."""
+    labels = [label.lstrip() for label in labels]
+
+    if file_type == "element":
+        label_length = max(len(label) for label in labels)
+        fmt = f"{{:>{label_length}}}"
+        labels = [fmt.format(label) for label in labels]
+
+    else:
+        # Find end of first element processing backward
+        labels = [label[::-1] for label in labels]
+        tmp = max(labels, key=len)
+
+        while True:
+            iend = tmp.index(" ")
 
-def _read_table(f, file_type, time_steps=None):
-    """Read data table for current time step."""
+            if iend < 2:
+                tmp = f"{tmp[:iend]}0{tmp[iend + 1:]}"
+
+            else:
+                break
+
+        iend += len(tmp[iend:]) - len(tmp[iend:].lstrip())
+
+        # Split connection names
+        labels1 = [label[iend:].rstrip() for label in labels]
+        labels2 = [label[:iend].rstrip() for label in labels]
+
+        # Find label length
+        len1 = max(len(label) for label in labels1)
+        len2 = max(len(label) for label in labels2)
+        label_length = max(len1, len2)
+
+        # Correct element names given label length
+        fmt = f"{{:<{label_length}}}"
+        labels1 = [fmt.format(label) for label in labels1]
+        labels2 = [fmt.format(label) for label in labels2]
+        labels = [[l1[::-1], l2[::-1]] for l1, l2 in zip(labels1, labels2)]
+
+    ilab = 1 if file_type == "element" else 2
+    headers = headers[ilab + 1 :]
+
+    return headers, labels
+
+
+def _read_table(f, file_type, time_steps=None, variables=None, engine="python"):
+    """Iterate over data tables of all (or selected) time steps."""
     labels_key = "ELEM." if file_type == "element" else "ELEM1"
 
     t_step = -1
-    times, data = [], []
     for line in f:
         line = line.strip()
 
@@ -113,8 +317,7 @@ def _read_table(f, file_type, time_steps=None):
 
             # Read time step in following line
             line = next(f).strip()
-            times.append(float(line.split()[0]))
-            data.append([])
+            time = float(line.split()[0])
 
             # Look for "ELEM." or "ELEM1"
             while True:
@@ -126,78 +329,157 @@ def _read_table(f, file_type, time_steps=None):
                 except StopIteration:
                     raise ValueError(f"No data related to {file_type}s found.")
 
-            # Read headers
-            headers = line.split()
+            yield (time, *_read_block(f, line, variables, engine))
 
-            # Read units
-            line = next(f)
-            nwsp = line.index(
-                line.strip()[0]
-            )  # Index of first non whitespace character
 
-            # Look for next non-empty line
-            while True:
-                line = next(f)
-                if line.strip():
-                    break
+def _read_table_index(f, file_type, index, time_steps, variables=None, engine="python"):
+    """Iterate over data tables of selected time steps given byte offsets."""
+    for t_step in sorted(time_steps):
+        if not 0 <= t_step < len(index):
+            continue
 
-            # Loop until end of output block
-            reader = lambda line: [to_float(x) for x in line.split()]
-            reader2 = None
+        time, offsets = index[t_step]
+        if offsets[file_type] is None:
+            raise ValueError(f"No data related to {file_type}s found.")
+
+        # Move to "ELEM." or "ELEM1"
+        f.seek(offsets[file_type])
+        line = next(f).strip()
+
+        yield (time, *_read_block(f, line, variables, engine))
+
+
+def _read_block(f, line, variables=None, engine="python"):
+    """Read data table starting from header line."""
+    # Read headers
+    headers = line.split()
+    n_cols = headers[::-1].index("INDEX")
+
+    # Only keep selected data columns
+    headers_, columns = get_columns(headers[-n_cols:], variables)
+    headers = headers[:-n_cols] + headers_
+
+    # Read units
+    line = next(f)
+    nwsp = line.index(line.strip()[0])  # Index of first non whitespace character
+
+    # Look for next non-empty line
+    while True:
+        line = next(f)
+        if line.strip():
+            break
+
+    # Loop until end of output block
+    lines = []
+
+    while True:
+        if line[:nwsp].strip() and not line.strip().startswith("ELEM"):
+            lines.append(line)
+
+        line = next(f)
+        if line[1:].startswith("@@@@@"):
+            break
+
+    # Parse data lines
+    if engine == "fast":
+        try:
+            return (headers, *_parse_lines_fast(lines, n_cols, columns))
+
+        except ValueError:
+            pass
+
+    return (headers, *_parse_lines(lines, n_cols, columns))
 
-            while True:
-                if line[:nwsp].strip() and not line.strip().startswith("ELEM"):
-                    if reader2 is None:
-                        # Find first floating point
-                        x = line.split()[-headers[::-1].index("INDEX")]
 
-                        # Find end of label(s)
-                        tmp = line[: line.index(x)].rstrip()
-                        tmp = tmp[::-1]
-                        tmp = tmp[: line.index(" ") : -1].rstrip()
-                        iend = len(tmp)
+def _parse_lines(lines, n_cols, columns=None):
+    """Parse data lines one by one."""
+    iend, nidx, di = _get_layout(lines[0], n_cols)
 
-                    tmp = [line[:iend]]
-                    line = line[iend:]
+    # Initialize data format
+    fmt = [f"{nidx}s"]
+    if di is not None:
+        dfmt = f"{di}.{di - 7}e"
+        fmt += 20 * [dfmt]  # Read 20 data columns at most
 
-                    if reader2 is None:
-                        # Determine number of characters for index
-                        idx = line.replace("-", " ").split()[0]
-                        nidx = line.index(idx) + len(idx)
-                        ifmt = f"{nidx}s"
+    else:
+        fmt += ["12.5e"]
 
-                        # Determine number of characters between two Es
-                        i1 = line.find("E")
-                        i2 = line.find("E", i1 + 1)
+    fmt = ",".join(fmt)
 
-                        # Initialize data format
-                        fmt = [ifmt]
-                        if i2 >= 0:
-                            di = i2 - i1
-                            dfmt = f"{di}.{di - 7}e"
-                            fmt += 20 * [dfmt]  # Read 20 data columns at most
+    # Set line parsers
+    reader = lambda line: [to_float(x) for x in line.split()]
+    reader2 = partial(read_record, fmt=fmt)
 
-                        else:
-                            fmt += ["12.5e"]
+    labels, data = [], []
+    for line in lines:
+        labels.append(line[:iend])
+        line = line[iend:]
 
-                        fmt = ",".join(fmt)
+        try:
+            tmp = reader(line)
 
-                        # Set second line parser
-                        reader2 = partial(read_record, fmt=fmt)
+        except ValueError:
+            tmp = reader2(line)
 
-                    try:
-                        tmp += reader(line)
+        tmp = [x for x in tmp[1:] if x is not None]
+        data.append(tmp if columns is None else [tmp[i] for i in columns])
 
-                    except ValueError:
-                        tmp += reader2(line)
+    return labels, np.array(data)
 
-                    data[-1].append([x for x in tmp if x is not None])
 
-                line = next(f)
-                if line[1:].startswith("@@@@@"):
-                    break
+def _parse_lines_fast(lines, n_cols, columns=None):
+    """Parse all data lines at once given column layout of first record."""
+    iend, nidx, di = _get_layout(lines[0], n_cols)
+    ibeg = iend + nidx
 
-    return headers, times, data
+    # Convert lines to a 2D array of characters
+    lines = [line.rstrip("\n") for line in lines]
+    width = max(len(line) for line in lines)
+
+    if di is None:
+        if n_cols != 1:
+            raise ValueError()
+
+        di = width - ibeg
+
+    width = max(width, ibeg + n_cols * di)
+    buffer = "".join(line.ljust(width) for line in lines).encode()
+
+    if len(buffer) != len(lines) * width:
+        raise ValueError()
+
+    arr = np.frombuffer(buffer, dtype=np.uint8).reshape((len(lines), width))
+
+    # Decode fixed-width data columns (only selected ones)
+    labels = [line[:iend] for line in lines]
+    data = arr[:, ibeg : ibeg + n_cols * di].reshape((len(lines), n_cols, di))
+    data = data[:, columns] if columns is not None else data
+
+    return labels, to_float_array(data)
+
+
+def _get_layout(line, n_cols):
+    """Get end of label(s), number of characters for index and width of data columns."""
+    # Find first floating point
+    x = line.split()[-n_cols]
+
+    # Find end of label(s)
+    tmp = line[: line.index(x)].rstrip()
+    tmp = tmp[::-1]
+    tmp = tmp[: line.index(" ") : -1].rstrip()
+    iend = len(tmp)
+    line = line[iend:]
+
+    # Determine number of characters for index
+    idx = line.replace("-", " ").split()[0]
+    nidx = line.index(idx) + len(idx)
+
+    # Determine number of characters between two Es
+    i1 = line.find("E")
+    i2 = line.find("E", i1 + 1)
+    di = i2 - i1 if i2 >= 0 else None
+
+    return iend, nidx, di
 
 
 def _count_time_steps(filename):
@@ -209,3 +491,140 @@ def _count_time_steps(filename):
             count += int(line.strip().startswith("TOTAL TIME"))
 
     return count
+
+
+def _index_time_steps(filename):
+    """Index byte offsets of element and connection tables for each time step."""
+    index = []
+    blocks = index_lines(filename, b"TOTAL TIME")
+
+    if not blocks:
+        return index
+
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in blocks:
+                # Read time step in line following "TOTAL TIME"
+                mm.seek(start)
+                _ = mm.readline()
+                time = float(mm.readline().split()[0])
+
+                offsets = {
+                    "element": find_line(mm, b"ELEM.", start, end),
+                    "connection": find_line(mm, b"ELEM1", start, end),
+                }
+                index.append((time, offsets))
+
+    return index
+
+
+def read_times(filename):
+    """
+    Read time of each time step of TOUGH output file.
+
+    Only the lines following "TOTAL TIME" are decoded.
+
+    Parameters
+    ----------
+    filename : str or pathlike
+        Input file name.
+
+    Returns
+    -------
+    list
+        Time of each time step.
+
+    """
+    return [time for time, _ in get_time_step_index(filename, _index_time_steps)]
+
+
+def follow(
+    mm,
+    offset,
+    state,
+    file_type,
+    labels_order=None,
+    variables=None,
+    engine="python",
+):
+    """
+    Read completed time steps of a growing standard TOUGH output file.
+
+    Parameters
+    ----------
+    mm : mmap.mmap
+        Memory-mapped file.
+    offset : int
+        Byte offset from which to look for new time steps.
+    state : dict
+        Parser state (updated in place).
+    file_type : str
+        Input file type.
+    labels_order : sequence of array_like
+        List of labels. If None, output will be assumed ordered.
+    variables : sequence of str or None, optional, default None
+        List of variables to read. If None, all variables will be read.
+    engine : {'python', 'fast'}, optional, default 'python'
+        Parsing engine for data tables.
+
+    Returns
+    -------
+    list
+        Output data of completed time steps.
+    int
+        Byte offset of first incomplete time step.
+
+    """
+    key = b"ELEM." if file_type == "element" else b"ELEM1"
+    outputs = []
+
+    while True:
+        start = find_line(mm, b"TOTAL TIME", offset)
+        if start is None:
+            break
+
+        # Look for data table before next time step
+        end = find_line(mm, b"TOTAL TIME", next_line(mm, start))
+        table = find_line(mm, key, start, end)
+
+        if table is None:
+            if end is None:
+                break
+
+            offset = end
+            continue
+
+        # Data table is complete once its closing line has been written
+        stop = find_line(mm, b"@@@@@", next_line(mm, table), end)
+        if stop is None or mm.find(b"\n", stop) < 0:
+            break
+
+        mm.seek(start)
+        _ = mm.readline()
+        time = float(mm.readline().split()[0])
+
+        time, headers, labels, data = _read_table_mmap(
+            mm, (time, {file_type: table}), file_type, variables, engine
+        )
+
+        # Labels are only postprocessed when they differ from previous time step
+        if labels != state.get("labels"):
+            state["labels"] = labels
+            state["headers"], state["labels_"] = _postprocess(
+                headers, labels, file_type
+            )
+            state["labels_"] = to_labels(state["labels_"])
+
+        outputs.append(
+            to_output(
+                file_type,
+                labels_order,
+                state["headers"],
+                [time],
+                [state["labels_"]],
+                [data],
+            )
+        )
+        offset = next_line(mm, stop)
+
+    return outputs, offset
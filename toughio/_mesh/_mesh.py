@@ -14,6 +14,7 @@ from ._properties import (
     _qualities,
     _volumes,
 )
+from ._spatial import get_tree
 
 __all__ = [
     "CellBlock",
@@ -516,24 +517,36 @@ class Mesh:
             self.cell_data.update(out.data)
 
         elif isinstance(out, ConnectionOutput):
-            centers = self.centers
-            labels_map = {k: v for v, k in enumerate(self.labels)}
+            # Map connection labels to cell indices
+            labels = np.asarray(self.labels)
+            labels_ = np.reshape(out.labels, (-1, 2))
+            sorter = np.argsort(labels)
+            idx = np.searchsorted(labels, labels_, sorter=sorter)
+            idx = sorter[idx.clip(max=len(labels) - 1)]
 
-            data = {
-                k: [[[0.0, 0.0, 0.0]] for _ in range(self.n_cells)] for k in out.data
-            }
-            for i, (label1, label2) in enumerate(out.labels):
-                i1, i2 = labels_map[label1], labels_map[label2]
-                line = centers[i1] - centers[i2]
-                line /= np.linalg.norm(line)
+            mask = labels[idx] != labels_
+            if mask.any():
+                raise KeyError(str(labels_[mask][0]))
 
-                for k, v in out.data.items():
-                    iv = i1 if v[i] > 0.0 else i2
-                    data[k][iv].append(v[i] * line)
+            i1, i2 = idx.T
+
+            # Unit vectors along connection lines
+            centers = self.centers
+            lines = centers[i1] - centers[i2]
+            lines /= np.linalg.norm(lines, axis=1)[:, np.newaxis]
+
+            # Accumulate flow vectors in upstream cells
+            data = {}
+            for k, v in out.data.items():
+                v = np.asarray(v)
+                iv = np.where(v > 0.0, i1, i2)
+                data[k] = np.column_stack(
+                    [
+                        np.bincount(iv, weights=v * line, minlength=self.n_cells)
+                        for line in lines.T
+                    ]
+                )
 
-            data = {
-                k: np.array([np.sum(vv, axis=0) for vv in v]) for k, v in data.items()
-            }
             self.cell_data.update(data)
 
     def write(self, filename, file_format=None, **kwargs):
@@ -722,7 +735,7 @@ class Mesh:
         self._cell_data.update(cell_data)
         self._point_data = {}
 
-    def near(self, points):
+    def near(self, points, k=1, radius=None):
         """
         Return indices of cells nearest to query points.
 
@@ -730,33 +743,101 @@ class Mesh:
         ----------
         points : array_like
             Coordinates of points to query.
+        k : int, optional, default 1
+            Number of nearest cells to return for each query point.
+        radius : scalar or None, optional, default None
+            If not None, return all cells whose centers are within distance `radius` of
+            each query point (`k` is ignored).
 
         Returns
         -------
         int or array_like
-            Index of cell or indices of cells.
+            Index of cell or indices of cells. If `k` > 1, indices of the `k` nearest
+            cells. If `radius` is not None, list of indices of cells for each query
+            point. Indices are sorted by increasing distance.
 
-        """
-
-        def distance(point, points):
-            """Distance between point to list of points."""
-            dp = points - point
-            return np.einsum("ij,ij->i", dp, dp)
+        Note
+        ----
+        Queries use a spatial index built on first call (KD-tree if :mod:`scipy` is
+        available, grid of buckets otherwise).
 
+        """
         ndim = np.ndim(points)
         if ndim == 0:
             raise TypeError()
         elif ndim == 1:
-            points = np.array([points])
+            points = np.array([points], dtype=float)
         else:
-            points = np.asarray(points)
+            points = np.asarray(points, dtype=float)
         if points.shape[1] != self.points.shape[1]:
             raise ValueError()
 
-        centers = self.centers
-        idx = np.argmin([distance(point, centers) for point in points], axis=1)
+        tree = self._get_cached("_tree", lambda: get_tree(self.centers))
+        centers = tree.data
+
+        if radius is not None:
+            idx = []
+            for point, ids in zip(points, tree.query_ball_point(points, radius)):
+                ids = np.asarray(ids, dtype=int)
+                dp = centers[ids] - point
+                distances = np.einsum("ij,ij->i", dp, dp)
+                idx.append(ids[np.argsort(distances, kind="stable")])
+
+        else:
+            if not 0 < k <= self.n_cells:
+                raise ValueError()
+
+            _, idx = tree.query(points, k)
+
         return idx[0] if ndim == 1 else idx
 
+    def clear_cache(self):
+        """
+        Clear cache of geometric properties.
+
+        Geometric properties (e.g., centers, volumes, connections) are cached on first
+        access and recomputed when points or cells are reassigned. This method must be
+        called if points or cells are modified in place.
+
+        """
+        self._cache = {}
+
+    def _get_cached(self, name, func):
+        """Return cached geometric property (computed by `func` if necessary)."""
+        cache = getattr(self, "_cache", {})
+
+        # Cache is invalidated if points or cell blocks have been replaced
+        if not (
+            cache.get("points") is self._points
+            and len(cache.get("cells", [])) == len(self._cells)
+            and all(x is c.data for x, c in zip(cache["cells"], self._cells))
+        ):
+            cache = {"points": self._points, "cells": [c.data for c in self._cells]}
+            self._cache = cache
+
+        if name not in cache:
+            cache[name] = func()
+
+        # Arrays and lists of arrays are copied so that in-place operations do not
+        # alter the cache
+        value = cache[name]
+
+        if isinstance(value, np.ndarray):
+            return value.copy()
+
+        elif isinstance(value, list):
+            return deepcopy(value)
+
+        else:
+            return value
+
+    def __getstate__(self):
+        """Do not pickle cache."""
+        state = self.__dict__.copy()
+        state.pop("_cache", None)
+
+        return state
+
     @property
     def points(self):
         """Return coordinates of points."""
@@ -765,6 +846,7 @@ class Mesh:
     @points.setter
     def points(self, value):
         self._points = value
+        self.clear_cache()
 
     @property
     def cells(self):
@@ -777,6 +859,7 @@ class Mesh:
             CellBlock(*c) if isinstance(c, (list, tuple)) else CellBlock(c.type, c.data)
             for c in value
         ]
+        self.clear_cache()
 
     @property
     def point_data(self):
@@ -856,7 +939,12 @@ class Mesh:
     @property
     def centers(self):
         """Return node centers of cell in mesh."""
-        return np.concatenate([self.points[c.data].mean(axis=1) for c in self.cells])
+        return self._get_cached(
+            "centers",
+            lambda: np.concatenate(
+                [self.points[c.data].mean(axis=1) for c in self.cells]
+            ),
+        )
 
     @property
     def materials(self):
@@ -866,28 +954,22 @@ class Mesh:
     @property
     def faces(self):
         """Return connectivity of faces of cell in mesh."""
-        out = _faces(self)
-        arr = np.full((self.n_cells, 6, 4), -1)
-        for i, x in enumerate(out):
-            arr[i, : len(x[0]), : x[0].shape[1]] = x[0]
-            if len(x) > 1:
-                arr[i, len(x[0]) : len(x[0]) + len(x[1]), : x[1].shape[1]] = x[1]
-        return arr
+        return self._get_cached("faces", lambda: _faces(self))
 
     @property
     def face_normals(self):
         """Return normal vectors of faces in mesh."""
-        return _face_normals(self)
+        return self._get_cached("face_normals", lambda: _face_normals(self))
 
     @property
     def face_areas(self):
         """Return areas of faces in mesh."""
-        return _face_areas(self)
+        return self._get_cached("face_areas", lambda: _face_areas(self))
 
     @property
     def volumes(self):
         """Return volumes of cell in mesh."""
-        return _volumes(self)
+        return self._get_cached("volumes", lambda: _volumes(self))
 
     @property
     def connections(self):
@@ -901,7 +983,35 @@ class Mesh:
         Only for 3D meshes and first order cells.
 
         """
-        return _connections(self)
+        return self._get_cached("connections", lambda: _connections(self))
+
+    @property
+    def adjacency(self):
+        """
+        Return cell adjacency matrix.
+
+        Non-zero entries indicate cells that share a face.
+
+        Note
+        ----
+        Requires :mod:`scipy`. The returned sparse matrix is cached and should not be
+        modified in place.
+
+        """
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError:
+            raise ImportError("Adjacency matrix requires scipy >= 0.9 to be installed.")
+
+        def adjacency():
+            connections = self.connections
+            rows, faces = np.nonzero(connections >= 0)
+            cols = connections[rows, faces]
+            data = np.ones(len(rows), dtype=int)
+
+            return csr_matrix((data, (rows, cols)), shape=(self.n_cells, self.n_cells))
+
+        return self._get_cached("adjacency", adjacency)
 
     @property
     def qualities(self):
@@ -912,7 +1022,9 @@ class Mesh:
         connection line and the interface normal vectors.
 
         """
-        return np.array([np.min(out) for out in _qualities(self)])
+        return self._get_cached(
+            "qualities", lambda: np.array([np.min(out) for out in _qualities(self)])
+        )
 
     @property
     def dim(self):
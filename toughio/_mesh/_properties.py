@@ -1,8 +1,33 @@
 import logging
-from itertools import chain
 
 import numpy as np
 
+meshio_type_to_faces = {
+    "tetra": {
+        "triangle": np.array([[1, 2, 3], [0, 3, 2], [0, 1, 3], [0, 2, 1]]),
+    },
+    "pyramid": {
+        "triangle": np.array([[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]),
+        "quad": np.array([[0, 3, 2, 1]]),
+    },
+    "wedge": {
+        "triangle": np.array([[0, 2, 1], [3, 4, 5]]),
+        "quad": np.array([[0, 1, 4, 3], [1, 2, 5, 4], [0, 3, 5, 2]]),
+    },
+    "hexahedron": {
+        "quad": np.array(
+            [
+                [0, 3, 2, 1],
+                [4, 5, 6, 7],
+                [0, 1, 5, 4],
+                [1, 2, 6, 5],
+                [2, 3, 7, 6],
+                [0, 4, 7, 3],
+            ]
+        ),
+    },
+}
+
 
 def _materials(mesh):
     """Return materials of cell in mesh."""
@@ -30,42 +55,28 @@ def _materials(mesh):
 
 def _faces(mesh):
     """Return connectivity of faces of cell in mesh."""
-    meshio_type_to_faces = {
-        "tetra": {
-            "triangle": np.array([[1, 2, 3], [0, 3, 2], [0, 1, 3], [0, 2, 1]]),
-        },
-        "pyramid": {
-            "triangle": np.array([[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]),
-            "quad": np.array([[0, 3, 2, 1]]),
-        },
-        "wedge": {
-            "triangle": np.array([[0, 2, 1], [3, 4, 5]]),
-            "quad": np.array([[0, 1, 4, 3], [1, 2, 5, 4], [0, 3, 5, 2]]),
-        },
-        "hexahedron": {
-            "quad": np.array(
-                [
-                    [0, 3, 2, 1],
-                    [4, 5, 6, 7],
-                    [0, 1, 5, 4],
-                    [1, 2, 6, 5],
-                    [2, 3, 7, 6],
-                    [0, 4, 7, 3],
-                ]
-            ),
-        },
-    }
+    out = np.full((mesh.n_cells, 6, 4), -1)
 
-    return [
-        [c[v] for v in meshio_type_to_faces[cell.type].values()]
-        for cell in mesh.cells
-        for c in cell.data
-    ]
+    offset = 0
+    for cell in mesh.cells:
+        n_cells = len(cell.data)
+        iface = 0
+
+        for v in meshio_type_to_faces[cell.type].values():
+            n_faces, n_vert = v.shape
+            out[offset : offset + n_cells, iface : iface + n_faces, :n_vert] = (
+                np.asarray(cell.data)[:, v]
+            )
+            iface += n_faces
+
+        offset += n_cells
+
+    return out
 
 
 def _face_normals(mesh):
     """Return normal vectors of faces in mesh."""
-    faces_dict, faces_cell, _ = _get_faces(_faces(mesh))
+    faces_dict, faces_cell, _ = mesh._get_cached("_faces", lambda: _get_faces(mesh))
 
     # Face normal vectors
     normals = np.concatenate(
@@ -85,7 +96,7 @@ def _face_normals(mesh):
 
 def _face_areas(mesh):
     """Return areas of faces in mesh."""
-    faces_dict, faces_cell, _ = _get_faces(_faces(mesh))
+    faces_dict, faces_cell, _ = mesh._get_cached("_faces", lambda: _get_faces(mesh))
 
     # Face areas
     areas = np.concatenate(
@@ -159,27 +170,8 @@ def _connections(mesh):
     if np.shape(mesh.points)[1] != 3:
         raise ValueError("Connections for 2D mesh has not been implemented yet.")
 
-    faces_dict, faces_cell, faces_index = _get_faces(_faces(mesh))
-    faces_dict = {k: np.sort(np.vstack(v), axis=1) for k, v in faces_dict.items()}
-
-    # Prune duplicate faces
-    uf, tmp1, tmp2 = {}, {}, {}
-    for k, v in faces_dict.items():
-        up, uf[k] = np.unique(v, axis=0, return_inverse=True)
-        tmp1[k] = [[] for _ in range(len(up))]
-        tmp2[k] = [[] for _ in range(len(up))]
-
-    # Make connections
-    for k, v in uf.items():
-        for i, j in enumerate(v):
-            tmp1[k][j].append(faces_cell[k][i])
-            tmp2[k][j].append(faces_index[k][i])
-    conne = [vv for v in tmp1.values() for vv in v if len(vv) == 2]
-    iface = [vv for v in tmp2.values() for vv in v if len(vv) == 2]
-
-    # Reorganize output
     out = np.full((mesh.n_cells, 6), -1)
-    for (i1, i2), (j1, j2) in zip(conne, iface):
+    for (i1, i2), (j1, j2) in _get_shared_faces(mesh):
         out[i1, j1] = i2
         out[i2, j2] = i1
 
@@ -217,34 +209,74 @@ def _qualities(mesh):
     return out
 
 
-def _get_faces(faces):
+def _get_faces(mesh):
     """Return dictionary of faces."""
     faces_dict = {"triangle": [], "quad": []}
     faces_cell = {"triangle": [], "quad": []}
     faces_index = {"triangle": [], "quad": []}
-    numvert_to_face_type = {3: "triangle", 4: "quad"}
 
-    for i, face in enumerate(faces):
-        for j, f in enumerate(chain.from_iterable(face)):
-            n = len(f)
-            face_type = numvert_to_face_type[n]
-            faces_dict[face_type].append(f[:n])
-            faces_cell[face_type].append(i)
-            faces_index[face_type].append(j)
+    # Faces of all cells in a cell block are extracted at once
+    offset = 0
+    for cell in mesh.cells:
+        n_cells = len(cell.data)
+        iface = 0
+
+        for face_type, v in meshio_type_to_faces[cell.type].items():
+            n_faces, n_vert = v.shape
+            faces_dict[face_type].append(
+                np.asarray(cell.data)[:, v].reshape((-1, n_vert))
+            )
+            faces_cell[face_type].append(
+                np.repeat(np.arange(offset, offset + n_cells), n_faces)
+            )
+            faces_index[face_type].append(
+                np.tile(np.arange(iface, iface + n_faces), n_cells)
+            )
+            iface += n_faces
+
+        offset += n_cells
 
     # Stack arrays or remove empty cells
-    faces_dict = {k: np.vstack(v) for k, v in faces_dict.items() if len(v)}
-    faces_cell = {k: v for k, v in faces_cell.items() if len(v)}
-    faces_index = {k: v for k, v in faces_index.items() if len(v)}
+    faces_dict = {k: np.concatenate(v) for k, v in faces_dict.items() if len(v)}
+    faces_cell = {k: np.concatenate(v) for k, v in faces_cell.items() if len(v)}
+    faces_index = {k: np.concatenate(v) for k, v in faces_index.items() if len(v)}
 
     return faces_dict, faces_cell, faces_index
 
 
+def _get_shared_faces(mesh):
+    """Return cells and local face indices of faces shared by exactly two cells."""
+    faces_dict, faces_cell, faces_index = mesh._get_cached(
+        "_faces", lambda: _get_faces(mesh)
+    )
+
+    out = []
+    for k, v in faces_dict.items():
+        # Identical faces are consecutive once sorted by vertices (stable sort)
+        v = np.sort(v, axis=1)
+        order = np.lexsort(v.T[::-1])
+        v = v[order]
+
+        # Faces shared by more than two cells are discarded
+        same = np.concatenate(([False], (v[1:] == v[:-1]).all(axis=1), [False]))
+        idx = np.nonzero(same[1:-1] & ~same[:-2] & ~same[2:])[0]
+
+        i1, i2 = order[idx], order[idx + 1]
+        out.append(
+            (
+                (faces_cell[k][i1], faces_cell[k][i2]),
+                (faces_index[k][i1], faces_index[k][i2]),
+            )
+        )
+
+    return out
+
+
 def _get_triangle_normals(mesh, faces, islice=None):
     """Calculate normal vectors of triangular faces."""
     islice = islice if islice is not None else [0, 1, 2]
 
-    triangles = np.vstack([c[islice] for c in faces])
+    triangles = faces[:, islice]
     triangles = mesh.points[triangles]
 
     return _cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
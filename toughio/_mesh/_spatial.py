@@ -0,0 +1,180 @@
+import numpy as np
+
+__all__ = [
+    "GridTree",
+    "get_tree",
+]
+
+
+class GridTree:
+    def __init__(self, data, leafsize=8):
+        """
+        Spatial index based on a regular grid of buckets.
+
+        Fallback for :class:`scipy.spatial.cKDTree` with a compatible subset of its
+        interface.
+
+        Parameters
+        ----------
+        data : array_like
+            Coordinates of points to index.
+        leafsize : int, optional, default 8
+            Average number of points per bucket.
+
+        """
+        self.data = np.asarray(data, dtype=float)
+        self.n, self.m = self.data.shape
+
+        # Bucket size is chosen so that buckets hold about leafsize points
+        self.mins = self.data.min(axis=0) if self.n else np.zeros(self.m)
+        extent = self.data.max(axis=0) - self.mins if self.n else np.zeros(self.m)
+        active = extent > 0.0
+
+        # Axes with extent smaller than bucket size are not subdivided
+        self.h = 1.0
+        n_buckets = max(self.n / leafsize, 1.0)
+        while active.any():
+            volume = np.prod(extent[active])
+            self.h = (volume / n_buckets) ** (1.0 / active.sum())
+
+            if (active == (extent >= self.h)).all():
+                break
+
+            active &= extent >= self.h
+
+        self.shape = (extent // self.h).astype(int) + 1
+
+        # Points are sorted by bucket
+        bucket = self._ravel(self._bucket(self.data))
+        self.order = np.argsort(bucket, kind="stable")
+        bounds = np.searchsorted(bucket[self.order], np.arange(self.shape.prod() + 1))
+        self.starts, self.ends = bounds[:-1], bounds[1:]
+
+    def query(self, x, k=1):
+        """
+        Query the k nearest points.
+
+        Parameters
+        ----------
+        x : array_like
+            Coordinates of points to query.
+        k : int, optional, default 1
+            Number of nearest points to return.
+
+        Returns
+        -------
+        array_like
+            Distances to the nearest points.
+        array_like
+            Indices of the nearest points.
+
+        """
+        if not 0 < k <= self.n:
+            raise ValueError()
+
+        x = np.asarray(x, dtype=float)
+        x2d = np.reshape(x, (-1, self.m))
+
+        distances = np.empty((len(x2d), k))
+        indices = np.empty((len(x2d), k), dtype=int)
+        for i, point in enumerate(x2d):
+            distances[i], indices[i] = self._query(point, k)
+
+        if k == 1:
+            distances, indices = distances[:, 0], indices[:, 0]
+
+        if x.ndim == 1:
+            distances, indices = distances[0], indices[0]
+
+        return distances, indices
+
+    def query_ball_point(self, x, r):
+        """
+        Query points within distance r.
+
+        Parameters
+        ----------
+        x : array_like
+            Coordinates of points to query.
+        r : scalar
+            Search radius.
+
+        Returns
+        -------
+        list or array of lists
+            Indices of the points within distance r.
+
+        """
+        x = np.asarray(x, dtype=float)
+        x2d = np.reshape(x, (-1, self.m))
+        radius = int(r // self.h) + 1
+
+        out = np.empty(len(x2d), dtype=object)
+        for i, point in enumerate(x2d):
+            idx, distances = self._candidates(point, radius)
+            out[i] = idx[distances <= r * r].tolist()
+
+        return out[0] if x.ndim == 1 else out
+
+    def _query(self, point, k):
+        """Query the k nearest points of a point by growing the search cube."""
+        bucket = self._bucket(point)
+        radius_max = np.maximum(bucket, self.shape - 1 - bucket).max()
+
+        radius = 1
+        while True:
+            idx, distances = self._candidates(point, radius)
+
+            # Points outside the search cube are farther than (radius * h)
+            if len(idx) >= k:
+                i = np.argsort(distances, kind="stable")[:k]
+
+                if radius >= radius_max or distances[i[-1]] <= (radius * self.h) ** 2:
+                    return np.sqrt(distances[i]), idx[i]
+
+            radius *= 2
+
+    def _candidates(self, point, radius):
+        """Return points in buckets within radius of bucket of a point."""
+        bucket = self._bucket(point)
+        lower = np.maximum(bucket - radius, 0)
+        upper = np.minimum(bucket + radius, self.shape - 1)
+
+        if (lower > upper).any():
+            return np.empty(0, dtype=int), np.empty(0)
+
+        buckets = np.meshgrid(
+            *[np.arange(l, u + 1) for l, u in zip(lower, upper)], indexing="ij"
+        )
+        buckets = self._ravel(np.column_stack([b.ravel() for b in buckets]))
+
+        # Concatenate ranges of sorted points
+        starts, ends = self.starts[buckets], self.ends[buckets]
+        lengths = ends - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        idx = self.order[offsets + np.arange(lengths.sum())]
+
+        dp = self.data[idx] - point
+
+        return idx, np.einsum("ij,ij->i", dp, dp)
+
+    def _bucket(self, x):
+        """Return bucket indices of points (may be outside of grid)."""
+        return np.floor((x - self.mins) / self.h).astype(int)
+
+    def _ravel(self, ijk):
+        """Return flat bucket indices."""
+        ijk = np.clip(ijk, 0, self.shape - 1)
+
+        return np.ravel_multi_index(ijk.T, self.shape)
+
+
+def get_tree(data):
+    """Return a spatial index (KD-tree if scipy is available)."""
+    try:
+        from scipy.spatial import cKDTree
+
+        return cKDTree(data)
+
+    except ImportError:
+        return GridTree(data)
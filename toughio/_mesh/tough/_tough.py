@@ -4,6 +4,7 @@ import os
 import numpy as np
 
 from ..._common import open_file
+from .._properties import _cross
 from ._helpers import block
 
 __all__ = [
@@ -73,8 +74,6 @@ def write(
 
     # Define parameters related to faces
     faces = mesh.faces
-    face_normals = mesh.face_normals
-    face_areas = mesh.face_areas
 
     # Required variables for block INCON
     primary_variables, porosities, permeabilities, phase_compositions = init_incon(mesh)
@@ -101,8 +100,6 @@ def write(
         connections,
         gravity,
         faces,
-        face_normals,
-        face_areas,
         nodal_distance,
         material_name,
         material_end,
@@ -191,8 +188,6 @@ def write_mesh(
     connections,
     gravity,
     faces,
-    face_normals,
-    face_areas,
     nodal_distance,
     material_name,
     material_end,
@@ -237,8 +232,6 @@ def write_mesh(
             gravity,
             boundary_conditions,
             faces,
-            face_normals,
-            face_areas,
             nodal_distance,
         )
 
@@ -331,44 +324,47 @@ def _write_conne(
     gravity,
     boundary_conditions,
     faces,
-    face_normals,
-    face_areas,
     nodal_distance,
 ):
     """Write CONNE block."""
     from ._helpers import _write_conne as writer
 
-    # Define unique connection variables
-    cell_list = set()
-    clabels, centers, int_points, int_normals, areas, bounds = [], [], [], [], [], []
-    for i, connection in enumerate(connections):
-        if (connection >= 0).any():
-            for iface, j in enumerate(connection):
-                if j >= 0 and j not in cell_list:
-                    # Label
-                    clabels.append((labels[i], labels[j]))
-
-                    # Nodal points
-                    centers.append([nodes[i], nodes[j]])
-
-                    # Common interface defined by single point and normal vector
-                    face = faces[i, iface]
-                    int_points.append(points[face[face >= 0][0]])
-                    int_normals.append(face_normals[i][iface])
-
-                    # Area of common face
-                    areas.append(face_areas[i][iface])
-
-                    # Boundary conditions
-                    bounds.append((boundary_conditions[i], boundary_conditions[j]))
-        else:
-            logging.warning(f"Element '{labels[i]}' is not connected to the grid.")
-        cell_list.add(i)
+    # Warn about cells that are not connected to the grid
+    for i in np.nonzero(~(connections >= 0).any(axis=1))[0]:
+        logging.warning(f"Element '{labels[i]}' is not connected to the grid.")
+
+    # Define unique connection variables (i <= j) in row-major order
+    rows, ifaces = np.nonzero(connections >= 0)
+    cols = connections[rows, ifaces]
+    mask = cols >= rows
+    rows, ifaces, cols = rows[mask], ifaces[mask], cols[mask]
+
+    # Label
+    clabels = [(labels[i], labels[j]) for i, j in zip(rows, cols)]
+
+    # Nodal points
+    centers = np.stack((nodes[rows], nodes[cols]), axis=1)
+
+    # Common interface defined by single point and normal vector
+    face = faces[rows, ifaces]
+    triangles = points[face[:, :3]]
+    int_points = triangles[:, 0]
+    int_normals = _cross(
+        triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+    )
+    areas = np.linalg.norm(int_normals, axis=-1)
+    int_normals /= areas[:, None]
+
+    # Area of common face (quadrangles are split in two triangles)
+    quad = face[:, 3] >= 0
+    tmp = points[face[quad][:, [0, 2, 3]]]
+    areas[quad] += np.linalg.norm(
+        _cross(tmp[:, 1] - tmp[:, 0], tmp[:, 2] - tmp[:, 0]), axis=-1
+    )
+    areas *= 0.5
 
-    centers = np.array(centers)
-    int_points = np.array(int_points)
-    int_normals = np.array(int_normals)
-    bounds = np.array(bounds)
+    # Boundary conditions
+    bounds = np.column_stack((boundary_conditions[rows], boundary_conditions[cols]))
 
     # Calculate remaining variables
     lines = np.diff(centers, axis=1)[:, 0]